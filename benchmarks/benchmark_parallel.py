@@ -3,62 +3,176 @@
 
 from __future__ import annotations
 
+import contextlib
+import gc
 import os
-import random
 import statistics
 import string
 import tempfile
+import threading
 import time
-from datetime import date, datetime, timedelta
+import zipfile
 from pathlib import Path
-
-
-def generate_test_csv(filepath: str, rows: int, cols: int, seed: int = 42) -> str:
-    """Generate a test CSV with mixed data types."""
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+def _generate_column(rng: np.random.Generator, rows: int, col_type: int) -> NDArray[np.str_]:
+    """Generate one CSV column of ``rows`` already-formatted string cells.
+
+    Args:
+        rng: The shared numpy Generator.
+        rows: Number of cells to draw.
+        col_type: Which of the six column types to produce.
+
+    Returns:
+        A numpy unicode array of formatted cell texts.
+    """
+    import numpy as np
+
+    if col_type == 0:
+        # Integer
+        return rng.integers(-10000, 10001, rows).astype("U6")
+    if col_type == 1:
+        # Float, fixed 4 decimal places
+        return np.char.mod("%.4f", rng.uniform(-1000, 1000, rows))
+    if col_type == 2:
+        # Boolean
+        return rng.choice(np.array(["true", "false", "TRUE", "FALSE"]), rows)
+    if col_type == 3:
+        # Date, ISO days -- datetime64[D]'s str form is exactly %Y-%m-%d
+        days = rng.integers(0, 1001, rows).astype("timedelta64[D]")
+        return (np.datetime64("2020-01-01") + days).astype("U10")
+    if col_type == 4:
+        # Datetime at second precision -- datetime64[s]'s str form is
+        # exactly %Y-%m-%dT%H:%M:%S
+        seconds = (
+            rng.integers(0, 1001, rows) * 86400
+            + rng.integers(0, 24, rows) * 3600
+            + rng.integers(0, 60, rows) * 60
+        ).astype("timedelta64[s]")
+        return (np.datetime64("2020-01-01T00:00:00") + seconds).astype("U19")
+    # String of 5-20 letters: draw all characters as one (rows, 20) block,
+    # zero out the tail beyond each row's length, and reinterpret as |S20 --
+    # numpy's bytes dtype drops trailing NULs, so the mask is the truncation.
+    letters = np.frombuffer(string.ascii_letters.encode("ascii"), dtype=np.uint8)
+    lengths = rng.integers(5, 21, rows)
+    codes = letters[rng.integers(0, len(letters), size=(rows, 20))]
+    codes[np.arange(20) >= lengths[:, None]] = 0
+    return codes.view("S20").ravel().astype("U20")
+
+
+def _write_csv_rows(filepath: str, rows: int, cols: int, seed: int) -> None:
+    """Append ``rows`` formatted CSV rows (no header) to ``filepath``."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    columns = [_generate_column(rng, rows, col % 6) for col in range(cols)]
+
+    # Fold the columns into one row-strings array with vectorized
+    # concatenation; 2*cols passes over the data, no per-cell Python.
+    lines = columns[0]
+    for column in columns[1:]:
+        lines = np.char.add(np.char.add(lines, ","), column)
+
+    # Binary mode with a large buffer, writing ~1 MiB batches of pre-encoded
+    # rows: one encode and a handful of syscalls per batch, and no giant
+    # all-rows string materialized just to write it out.
+    rows_per_batch = max(1, 1_000_000 // max(1, lines.itemsize))
+    with Path(filepath).open("ab", buffering=8 * 1024 * 1024) as f:
+        for start_row in range(0, rows, rows_per_batch):
+            batch = lines[start_row:start_row + rows_per_batch]
+            f.write("\n".join(batch).encode("ascii"))
+            f.write(b"\n")
+
+
+def _append_file(dst_fd: int, src_path: str) -> None:
+    """Append ``src_path`` to the open descriptor ``dst_fd``.
+
+    Uses os.sendfile where it works (kernel-space copy, no Python buffer
+    churn); falls back to a read/write loop elsewhere. The existence check
+    is not enough: macOS has os.sendfile, but the Darwin syscall only
+    accepts a socket as the destination, so a file-to-file copy raises
+    OSError on the first call and must fall through rather than crash.
+    """
+    with Path(src_path).open("rb") as src:
+        offset = 0
+        if hasattr(os, "sendfile"):
+            size = Path(src_path).stat().st_size
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                pass  # resume from offset via the portable loop below
+        src.seek(offset)
+        while chunk := src.read(8 * 1024 * 1024):
+            os.write(dst_fd, chunk)
+
+
+def generate_test_csv(
+    filepath: str, rows: int, cols: int, seed: int = 42, parallel_gen: bool = False
+) -> str:
+    """Generate a test CSV with mixed data types.
+
+    Every column is synthesized as one vectorized numpy draw and formatted
+    array-at-a-time, instead of rows x cols Python-level RNG and strftime
+    calls, so setup time stays a small fraction of the conversion being
+    benchmarked even at --rows 500000.
+
+    With ``parallel_gen`` the row range is split across one worker process
+    per core, each writing its chunk to its own temp file with an
+    independently seeded generator, and the chunks are stitched together
+    with sendfile. Output is still deterministic for a given seed, but the
+    rows differ from the sequential layout because each worker draws its
+    own stream.
+    """
     print(f"Generating test CSV: {rows:,} rows x {cols} columns...")
-    random.seed(seed)
 
     start = time.perf_counter()
-    with Path(filepath).open("w", encoding="utf-8") as f:
-        # Header
-        headers = [f"col_{i}" for i in range(cols)]
-        f.write(','.join(headers) + '\n')
-
-        # Data rows with mixed types
-        base_date = date(2020, 1, 1)
-        base_datetime = datetime(2020, 1, 1, 0, 0, 0)
-
-        for _row in range(rows):
-            values: list[str] = []
-            for col in range(cols):
-                col_type = col % 6
-                if col_type == 0:
-                    # Integer
-                    values.append(str(random.randint(-10000, 10000)))
-                elif col_type == 1:
-                    # Float
-                    values.append(f"{random.uniform(-1000, 1000):.4f}")
-                elif col_type == 2:
-                    # Boolean
-                    values.append(random.choice(['true', 'false', 'TRUE', 'FALSE']))
-                elif col_type == 3:
-                    # Date
-                    d = base_date + timedelta(days=random.randint(0, 1000))
-                    values.append(d.strftime('%Y-%m-%d'))
-                elif col_type == 4:
-                    # Datetime
-                    dt = base_datetime + timedelta(
-                        days=random.randint(0, 1000),
-                        hours=random.randint(0, 23),
-                        minutes=random.randint(0, 59)
-                    )
-                    values.append(dt.strftime('%Y-%m-%dT%H:%M:%S'))
-                else:
-                    # String
-                    length = random.randint(5, 20)
-                    values.append(''.join(random.choices(string.ascii_letters, k=length)))
-
-            f.write(','.join(values) + '\n')
+    header = (",".join(f"col_{i}" for i in range(cols)) + "\n").encode("ascii")
+
+    workers = min(os.cpu_count() or 1, max(1, rows // 50_000))
+    if parallel_gen and workers > 1:
+        import multiprocessing
+
+        chunk_rows = [rows // workers] * workers
+        chunk_rows[-1] += rows - sum(chunk_rows)
+        chunk_paths: list[str] = []
+        try:
+            for i in range(workers):
+                fd, path = tempfile.mkstemp(suffix=f".csvchunk{i}")
+                os.close(fd)
+                chunk_paths.append(path)
+            with multiprocessing.Pool(workers) as pool:
+                pool.starmap(
+                    _write_csv_rows,
+                    [
+                        # Offset seeds per chunk so workers draw disjoint streams.
+                        (path, n, cols, seed + i)
+                        for i, (path, n) in enumerate(
+                            zip(chunk_paths, chunk_rows, strict=True)
+                        )
+                    ],
+                )
+            with Path(filepath).open("wb") as dst:
+                dst.write(header)
+                dst.flush()
+                for path in chunk_paths:
+                    _append_file(dst.fileno(), path)
+        finally:
+            for path in chunk_paths:
+                Path(path).unlink(missing_ok=True)
+    else:
+        Path(filepath).write_bytes(header)
+        _write_csv_rows(filepath, rows, cols, seed)
 
     elapsed = time.perf_counter() - start
     file_size = Path(filepath).stat().st_size / (1024 * 1024)
@@ -66,44 +180,348 @@ def generate_test_csv(filepath: str, rows: int, cols: int, seed: int = 42) -> st
     return filepath
 
 
-def benchmark_conversion(
-    csv_path: str,
-    parallel: bool,
-    runs: int = 3,
-    warmup: bool = True,
-) -> tuple[float, float]:
-    """Benchmark CSV to XLSX conversion."""
-    import xlsxturbo
+def drop_page_cache(path: str) -> None:
+    """Ask the kernel to evict ``path`` from the page cache (Linux only).
 
-    mode = "parallel" if parallel else "single-threaded"
-    times: list[float] = []
+    On platforms without posix_fadvise this is a no-op, and runs after the
+    first simply stay hot-cache.
 
-    total_runs = runs + (1 if warmup else 0)
-    for run in range(total_runs):
-        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-            xlsx_path = tmp.name
+    Args:
+        path: File whose cached pages should be dropped.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def rss_sampler(interval: float = 0.01) -> Iterator[dict[str, float]]:
+    """Track peak resident set size over the with-block (Linux only).
+
+    A daemon thread polls /proc/self/statm every ``interval`` seconds; the
+    yielded dict's ``peak_rss_mb`` is filled in when the block exits. On
+    platforms without /proc it stays 0.0. Polling can miss a spike shorter
+    than the interval, but shared-string and cell-struct growth — the
+    regressions worth catching — build over the whole conversion.
+
+    Args:
+        interval: Seconds between samples.
+
+    Yields:
+        A dict whose ``peak_rss_mb`` key holds the peak once the block ends.
+    """
+    result = {"peak_rss_mb": 0.0}
+    statm = Path("/proc/self/statm")
+    if not statm.exists():
+        yield result
+        return
+    page_mb = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    stop = threading.Event()
+
+    def poll() -> None:
+        """Sample the resident page count until asked to stop."""
+        peak = 0
+        while True:
+            with contextlib.suppress(OSError, ValueError):
+                peak = max(peak, int(statm.read_text().split()[1]))
+            if stop.wait(interval):
+                break
+        result["peak_rss_mb"] = peak * page_mb
+
+    sampler = threading.Thread(target=poll, daemon=True)
+    sampler.start()
+    try:
+        yield result
+    finally:
+        stop.set()
+        sampler.join()
 
-        try:
+
+def _fault_counts() -> tuple[int, int]:
+    """Return cumulative (minor, major) page-fault counts for this process.
+
+    Returns (0, 0) where the resource module is unavailable (Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return (0, 0)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return (usage.ru_minflt, usage.ru_majflt)
+
+
+@contextlib.contextmanager
+def pinned_to_one_core() -> Iterator[None]:
+    """Pin the process to one core for the duration (Linux only).
+
+    Single-threaded runs migrate between cores mid-measurement otherwise,
+    and each migration costs a cold cache. The core is picked from the
+    process's current affinity mask rather than hard-coded to 0, and the
+    original mask is restored on exit so parallel runs see every core.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    original = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {min(original)})
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, original)
+
+
+class ConversionStats(NamedTuple):
+    """Timing summary for one conversion mode, in seconds.
+
+    ``cpu_median`` is process CPU time (user + system, all threads), so in
+    parallel mode it exceeds wall time; divergence between the two is how a
+    storage-bound run shows up. ``size_ratio`` is xlsx bytes over csv bytes
+    and ``sst_bytes`` the uncompressed size of xl/sharedStrings.xml — the
+    pair that moves when string de-duplication or the XML cell encoding
+    regresses without touching wall time.
+    """
+
+    median: float
+    stdev: float
+    min: float
+    p99: float
+    cpu_median: float
+    peak_rss_mb: float
+    majflt: int
+    size_ratio: float
+    sst_bytes: int
+
+
+def _measure_runs(
+    convert: Callable[[str], object],
+    mode: str,
+    csv_path: str,
+    runs: int,
+    warmup: bool,
+    hot_cache: bool,
+    pin: bool,
+    out_dir: str | None,
+) -> ConversionStats:
+    """Run ``convert`` into a reused xlsx path and collect timing stats.
+
+    One output path is created up front (in ``out_dir`` when given) and
+    overwritten in place by every run, rather than creating and unlinking a
+    temp file per run. By default the input CSV is evicted from the page
+    cache before each run so all runs measure the same cold-cache read; pass
+    ``hot_cache`` to leave the cache alone and measure steady-state instead.
+
+    Args:
+        convert: Called with the xlsx output path; performs one conversion.
+        mode: Label used in progress output.
+        csv_path: The source CSV, for cache eviction and the size ratio.
+        runs: Measured runs.
+        warmup: Whether to prepend one untimed run.
+        hot_cache: Skip the page-cache eviction before each run.
+        pin: Pin the process to one core for the measured region.
+        out_dir: Directory for the xlsx output (tmpfs when available).
+
+    Returns:
+        The collected :class:`ConversionStats`.
+    """
+    # Samples stay integer nanoseconds until display, sidestepping float
+    # rounding on microsecond-scale small-file runs.
+    times_ns: list[int] = []
+    cpu_ns: list[int] = []
+    peak_rss: list[float] = []
+    majflts: list[int] = []
+
+    fd, xlsx_path = tempfile.mkstemp(suffix=".xlsx", dir=out_dir)
+    os.close(fd)
+    try:
+        total_runs = runs + (1 if warmup else 0)
+        for run in range(total_runs):
             is_warmup = warmup and run == 0
             if is_warmup:
                 print(f"  warmup ({mode})...", flush=True)
 
-            start = time.perf_counter()
-            rows, cols = xlsxturbo.csv_to_xlsx(csv_path, xlsx_path, parallel=parallel)
-            elapsed = time.perf_counter() - start
+            if not hot_cache:
+                drop_page_cache(csv_path)
+
+            # Collect before, then hold the cyclic GC off for the measured
+            # region so a mid-run collection of parse temporaries never
+            # lands inside the timing window.
+            gc.collect()
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                with pinned_to_one_core() if pin else contextlib.nullcontext():
+                    _, majflt_before = _fault_counts()
+                    with rss_sampler() as rss:
+                        cpu_start = time.process_time_ns()
+                        start = time.perf_counter_ns()
+                        result = convert(xlsx_path)
+                        elapsed_ns = time.perf_counter_ns() - start
+                        elapsed_cpu_ns = time.process_time_ns() - cpu_start
+                    _, majflt_after = _fault_counts()
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
 
             if not is_warmup:
-                times.append(elapsed)
+                times_ns.append(elapsed_ns)
+                cpu_ns.append(elapsed_cpu_ns)
+                peak_rss.append(rss["peak_rss_mb"])
+                majflts.append(majflt_after - majflt_before)
 
             if run == 0:
+                rows, cols = result  # type: ignore[misc]  # both entry points return (rows, cols)
                 xlsx_size = Path(xlsx_path).stat().st_size / (1024 * 1024)
                 print(f"  {mode}: {rows:,} rows x {cols} cols -> {xlsx_size:.1f} MB")
-        finally:
-            Path(xlsx_path).unlink(missing_ok=True)
 
-    median_time = statistics.median(times)
-    stdev_time = statistics.stdev(times) if len(times) > 1 else 0.0
-    return median_time, stdev_time
+        size_ratio = Path(xlsx_path).stat().st_size / Path(csv_path).stat().st_size
+        with zipfile.ZipFile(xlsx_path) as zf:
+            try:
+                sst_bytes = zf.getinfo("xl/sharedStrings.xml").file_size
+            except KeyError:
+                # Inline-string output has no shared-string table.
+                sst_bytes = 0
+    finally:
+        Path(xlsx_path).unlink(missing_ok=True)
+
+    median_ns = statistics.median_low(times_ns)
+    stdev_ns = statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0
+    p99_ns = sorted(times_ns)[min(len(times_ns) - 1, int(0.99 * len(times_ns)))]
+    return ConversionStats(
+        median=median_ns / 1e9,
+        stdev=stdev_ns / 1e9,
+        min=min(times_ns) / 1e9,
+        p99=p99_ns / 1e9,
+        cpu_median=statistics.median_low(cpu_ns) / 1e9,
+        peak_rss_mb=max(peak_rss),
+        majflt=statistics.median_low(majflts),
+        size_ratio=size_ratio,
+        sst_bytes=sst_bytes,
+    )
+
+
+def benchmark_conversion(
+    csv_path: str,
+    parallel: bool,
+    runs: int = 5,
+    warmup: bool = True,
+    hot_cache: bool = False,
+    threads: int | None = None,
+    out_dir: str | None = None,
+) -> ConversionStats:
+    """Benchmark csv_to_xlsx; see :func:`_measure_runs` for the methodology."""
+    import xlsxturbo
+
+    if not parallel:
+        mode = "single-threaded"
+    elif threads is None:
+        mode = "parallel"
+    else:
+        mode = f"parallel[{threads}]"
+
+    def convert(xlsx_path: str) -> tuple[int, int]:
+        """Run one csv_to_xlsx conversion into ``xlsx_path``."""
+        return xlsxturbo.csv_to_xlsx(csv_path, xlsx_path, parallel=parallel, threads=threads)
+
+    return _measure_runs(
+        convert, mode, csv_path, runs, warmup, hot_cache, pin=not parallel, out_dir=out_dir
+    )
+
+
+def benchmark_df_write(
+    df: object,
+    csv_path: str,
+    runs: int = 5,
+    warmup: bool = True,
+    out_dir: str | None = None,
+) -> ConversionStats:
+    """Benchmark df_to_xlsx on an already-parsed frame.
+
+    The frame is parsed once by the caller, so these runs measure pure
+    XLSX-write throughput; the gap to the csv_to_xlsx numbers is the CSV
+    parse cost. Cache eviction is skipped (there is no input file read) and
+    the run is pinned like the single-threaded CSV mode, since df_to_xlsx
+    writes on one thread.
+
+    Args:
+        df: The pre-parsed DataFrame to write each run.
+        csv_path: The CSV the frame came from, for the size ratio.
+        runs: Measured runs.
+        warmup: Whether to prepend one untimed run.
+        out_dir: Directory for the xlsx output (tmpfs when available).
+
+    Returns:
+        The collected :class:`ConversionStats`.
+    """
+    import xlsxturbo
+
+    def convert(xlsx_path: str) -> tuple[int, int]:
+        """Run one df_to_xlsx write into ``xlsx_path``."""
+        return xlsxturbo.df_to_xlsx(df, xlsx_path)
+
+    return _measure_runs(
+        convert, "df-write", csv_path, runs, warmup, hot_cache=True, pin=True, out_dir=out_dir
+    )
+
+
+def run_thread_sweep(
+    csv_path: str,
+    thread_counts: list[int],
+    runs: int,
+    hot_cache: bool,
+    out_dir: str | None = None,
+) -> None:
+    """Measure conversion at each thread count and print the scaling curve.
+
+    The interesting number is where the curve flattens: past that point the
+    chunks are too small per worker and synchronization eats the parallelism.
+    Efficiency is speedup over the 1-thread run divided by the thread count,
+    so 1.00 is perfect linear scaling.
+
+    Args:
+        csv_path: The CSV file to convert at every thread count.
+        thread_counts: Thread counts to sweep, in the order given.
+        runs: Measured runs per thread count.
+        hot_cache: Passed through to :func:`benchmark_conversion`.
+        out_dir: Directory for the xlsx outputs (tmpfs when available).
+    """
+    results: dict[int, ConversionStats] = {}
+    for n in thread_counts:
+        print(f"Benchmarking {n} thread{'s' if n != 1 else ''} ({runs} runs + warmup)...")
+        results[n] = benchmark_conversion(
+            csv_path, parallel=True, runs=runs, hot_cache=hot_cache, threads=n, out_dir=out_dir
+        )
+        print()
+
+    base = results[thread_counts[0]].median
+    base_threads = thread_counts[0]
+    print("=" * 60)
+    print("Thread scaling:")
+    print("=" * 60)
+    print(
+        f"{'Threads':>7}  {'Median':>8}  {'Stdev':>8}  {'CPU':>8}  "
+        f"{'Speedup':>7}  {'Efficiency':>10}"
+    )
+    sublinear_from: int | None = None
+    for n in thread_counts:
+        stats = results[n]
+        speedup = base / stats.median
+        efficiency = speedup / (n / base_threads)
+        print(
+            f"{n:>7}  {stats.median:>7.2f}s  {stats.stdev:>7.2f}s  {stats.cpu_median:>7.2f}s  "
+            f"{speedup:>6.2f}x  {efficiency:>10.2f}"
+        )
+        if efficiency < 0.5 and n > base_threads and sublinear_from is None:
+            sublinear_from = n
+    if sublinear_from is not None:
+        print(
+            f"\n[WARN] Scaling is sublinear from {sublinear_from} threads "
+            "(efficiency < 0.5); extra threads past the knee mostly buy "
+            "synchronization cost. Try a larger --rows, or cap threads there."
+        )
 
 
 def main() -> None:
@@ -113,9 +531,50 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Benchmark xlsxturbo parallel processing")
     parser.add_argument("--rows", type=int, default=500000, help="Number of rows (default: 500000)")
     parser.add_argument("--cols", type=int, default=50, help="Number of columns (default: 50)")
-    parser.add_argument("--runs", type=int, default=3, help="Number of benchmark runs (default: 3)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of benchmark runs (default: 5)")
+    parser.add_argument(
+        "--thread-sweep",
+        type=lambda s: [int(v) for v in s.split(",")],
+        default=None,
+        metavar="1,2,4,8",
+        help="Sweep these parallel thread counts and print the scaling curve "
+        "instead of the single-vs-parallel comparison",
+    )
+    parser.add_argument(
+        "--path",
+        choices=["csv", "df", "both"],
+        default="csv",
+        help="What to measure: csv (csv_to_xlsx, the default), df "
+        "(df_to_xlsx on a once-parsed polars frame, i.e. pure XLSX-write "
+        "throughput), or both (also prints the implied CSV-parse cost)",
+    )
+    parser.add_argument(
+        "--parallel-gen",
+        action="store_true",
+        help="Generate the test CSV in parallel worker processes (one chunk "
+        "per core, stitched with sendfile); useful at 10M+ rows where "
+        "sequential generation becomes the setup bottleneck",
+    )
+    parser.add_argument(
+        "--disk",
+        action="store_true",
+        help="Keep the CSV and xlsx on the regular filesystem instead of "
+        "tmpfs (/dev/shm), including storage cost in the measurement",
+    )
+    parser.add_argument(
+        "--hot-cache",
+        action="store_true",
+        help="Leave the input CSV in the page cache between runs instead of "
+        "evicting it (measures steady-state rather than cold reads)",
+    )
     args = parser.parse_args()
 
+    if args.path in ("df", "both"):
+        try:
+            import polars  # noqa: F401
+        except ImportError:
+            parser.error("--path df/both requires polars to parse the CSV once")
+
     print("=" * 60)
     print("xlsxturbo Parallel Processing Benchmark")
     print("=" * 60)
@@ -125,35 +584,96 @@ def main() -> None:
     print(f"CPU cores: {os.cpu_count()}")
     print()
 
+    # Both the CSV and the xlsx live on tmpfs when available, so the
+    # numbers isolate conversion cost from storage jitter; --disk keeps
+    # them on the regular filesystem to measure the end-to-end path.
+    base_dir = None if args.disk else ("/dev/shm" if Path("/dev/shm").is_dir() else None)  # noqa: S108
+
     # Generate test data
-    with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as tmp:
+    with tempfile.NamedTemporaryFile(suffix='.csv', delete=False, dir=base_dir) as tmp:
         csv_path = tmp.name
 
     try:
-        generate_test_csv(csv_path, args.rows, args.cols)
+        generate_test_csv(csv_path, args.rows, args.cols, parallel_gen=args.parallel_gen)
         print()
 
+        if args.thread_sweep:
+            run_thread_sweep(
+                csv_path, args.thread_sweep, args.runs, args.hot_cache, out_dir=base_dir
+            )
+            return
+
+        df_stats = None
+        if args.path in ("df", "both"):
+            import polars as pl
+
+            df = pl.read_csv(csv_path, try_parse_dates=True)
+            print(f"Benchmarking df_to_xlsx on the parsed frame ({args.runs} runs + warmup)...")
+            df_stats = benchmark_df_write(df, csv_path, runs=args.runs, out_dir=base_dir)
+            print(f"  Median: {df_stats.median:.2f}s (stdev {df_stats.stdev:.2f}s, "
+                  f"min {df_stats.min:.2f}s, p99 {df_stats.p99:.2f}s, "
+                  f"cpu {df_stats.cpu_median:.2f}s)")
+            print(f"  Memory: peak RSS {df_stats.peak_rss_mb:.0f} MB, "
+                  f"major faults {df_stats.majflt}/run")
+            print()
+            if args.path == "df":
+                return
+
         # Benchmark single-threaded (warmup + runs)
         print(f"Benchmarking single-threaded ({args.runs} runs + warmup)...")
-        single_med, single_std = benchmark_conversion(csv_path, parallel=False, runs=args.runs)
-        print(f"  Median: {single_med:.2f}s (stdev {single_std:.2f}s)")
+        single = benchmark_conversion(
+            csv_path, parallel=False, runs=args.runs, hot_cache=args.hot_cache,
+            out_dir=base_dir,
+        )
+        print(f"  Median: {single.median:.2f}s (stdev {single.stdev:.2f}s, "
+              f"min {single.min:.2f}s, p99 {single.p99:.2f}s, "
+              f"cpu {single.cpu_median:.2f}s)")
+        print(f"  Memory: peak RSS {single.peak_rss_mb:.0f} MB, "
+              f"major faults {single.majflt}/run")
+        print(f"  Output: {single.size_ratio:.2f}x csv size, "
+              f"shared strings {single.sst_bytes / (1024 * 1024):.1f} MB uncompressed")
         print()
 
         # Benchmark parallel (warmup + runs)
         print(f"Benchmarking parallel ({args.runs} runs + warmup)...")
-        parallel_med, parallel_std = benchmark_conversion(csv_path, parallel=True, runs=args.runs)
-        print(f"  Median: {parallel_med:.2f}s (stdev {parallel_std:.2f}s)")
+        par = benchmark_conversion(
+            csv_path, parallel=True, runs=args.runs, hot_cache=args.hot_cache,
+            out_dir=base_dir,
+        )
+        print(f"  Median: {par.median:.2f}s (stdev {par.stdev:.2f}s, "
+              f"min {par.min:.2f}s, p99 {par.p99:.2f}s, "
+              f"cpu {par.cpu_median:.2f}s)")
+        print(f"  Memory: peak RSS {par.peak_rss_mb:.0f} MB, "
+              f"major faults {par.majflt}/run")
+        print(f"  Output: {par.size_ratio:.2f}x csv size, "
+              f"shared strings {par.sst_bytes / (1024 * 1024):.1f} MB uncompressed")
         print()
 
         # Results
         print("=" * 60)
         print("Results:")
         print("=" * 60)
-        speedup = single_med / parallel_med
-        print(f"Single-threaded: {single_med:.2f}s (stdev {single_std:.2f}s)")
-        print(f"Parallel:        {parallel_med:.2f}s (stdev {parallel_std:.2f}s)")
+        # Both modes parse the same cells, so any size divergence means the
+        # parallel path encoded them differently -- worth a loud flag.
+        if single.size_ratio != par.size_ratio or single.sst_bytes != par.sst_bytes:
+            print(
+                "[WARN] single-threaded and parallel outputs differ in size "
+                f"(ratio {single.size_ratio:.3f} vs {par.size_ratio:.3f}, "
+                f"shared strings {single.sst_bytes} vs {par.sst_bytes} bytes); "
+                "the two paths should encode cells identically."
+            )
+        speedup = single.median / par.median
+        print(f"Single-threaded: {single.median:.2f}s (stdev {single.stdev:.2f}s)")
+        print(f"Parallel:        {par.median:.2f}s (stdev {par.stdev:.2f}s)")
         print(f"Speedup:         {speedup:.2f}x")
 
+        if df_stats is not None:
+            # csv_to_xlsx = parse + write; df_to_xlsx on the parsed frame is
+            # write only, so the difference approximates the parse cost.
+            parse_cost = single.median - df_stats.median
+            print(f"XLSX write only:  {df_stats.median:.2f}s (df_to_xlsx); "
+                  f"implied CSV-parse cost {parse_cost:.2f}s")
+
         if speedup > 1:
             print(f"\n[OK] Parallel processing is {speedup:.2f}x faster!")
         else:
@@ -31,9 +31,19 @@ from .xlsxturbo import (
     csv_to_xlsx,
     df_to_xlsx,
     dfs_to_xlsx,
-    version,
 )
 
+
+def version() -> str:
+    """Return the xlsxturbo version string.
+
+    The value is fixed at build time, so it is read from the compiled
+    extension once at import; repeated calls return the cached constant
+    without crossing the FFI boundary, which matters to callers that log
+    the version inside hot loops.
+    """
+    return __version__
+
 __all__ = [
     "ConfigurationError",
     "ConfigurationTypeError",
@@ -31,9 +31,11 @@ from .xlsxturbo import (
     csv_to_xlsx as csv_to_xlsx,
     df_to_xlsx as df_to_xlsx,
     dfs_to_xlsx as dfs_to_xlsx,
-    version as version,
 )
 
+def version() -> str:
+    """Return the xlsxturbo version string (cached; no FFI call)."""
+
 __all__ = [
     "ConfigurationError",
     "ConfigurationTypeError",
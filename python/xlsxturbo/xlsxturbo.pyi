@@ -104,6 +104,7 @@ def csv_to_xlsx(
     sheet_name: str = "Sheet1",
     parallel: bool = False,
     date_order: DateOrder = "auto",
+    threads: int | None = None,
 ) -> tuple[int, int]:
     """Convert a CSV file to XLSX format with automatic type detection.
 
@@ -117,6 +118,9 @@ def csv_to_xlsx(
             "auto" - ISO first, then European (DMY), then US (MDY).
             "mdy" or "us" - US format: 01-02-2024 = January 2nd.
             "dmy" or "eu" - European format: 01-02-2024 = February 1st.
+        threads: Worker thread count for parallel mode (default: None, which
+            lets the thread pool size itself to the available cores).
+            Requires parallel=True.
 
     Note:
         String cells preserve surrounding whitespace (e.g. " padded " is
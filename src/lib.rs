@@ -217,6 +217,9 @@ fn extract_options(raw: &RawOptions<'_, '_>) -> PyResult<ExtractedOptions> {
 ///                 "auto" - ISO first, then European (DMY), then US (MDY)
 ///                 "mdy" or "us" - US format: 01-02-2024 = January 2nd
 ///                 "dmy" or "eu" - European format: 01-02-2024 = February 1st
+///     threads: Worker thread count for parallel mode (default: None, which
+///              lets the thread pool size itself to the available cores).
+///              Requires parallel=True.
 ///
 /// Returns:
 ///     Tuple of (rows, columns) written to the Excel file
@@ -232,7 +235,7 @@ fn extract_options(raw: &RawOptions<'_, '_>) -> PyResult<ExtractedOptions> {
 ///     >>> # For large files, use parallel processing:
 ///     >>> rows, cols = xlsxturbo.csv_to_xlsx("big.csv", "out.xlsx", parallel=True)
 #[pyfunction]
-#[pyo3(signature = (input_path, output_path, sheet_name = "Sheet1", parallel = false, date_order = "auto"))]
+#[pyo3(signature = (input_path, output_path, sheet_name = "Sheet1", parallel = false, date_order = "auto", threads = None))]
 fn csv_to_xlsx(
     py: Python<'_>,
     input_path: &Bound<'_, PyAny>,
@@ -240,6 +243,7 @@ fn csv_to_xlsx(
     sheet_name: &str,
     parallel: bool,
     date_order: &str,
+    threads: Option<usize>,
 ) -> PyResult<(u32, u16)> {
     let input_path = path_arg_to_string(input_path, "input_path")?;
     let output_path = path_arg_to_string(output_path, "output_path")?;
@@ -251,11 +255,40 @@ fn csv_to_xlsx(
         ))
     })?;
 
+    if threads.is_some() && !parallel {
+        return Err(errors::configuration(
+            "threads requires parallel=True".to_string(),
+        ));
+    }
+    if threads == Some(0) {
+        return Err(errors::configuration(
+            "threads must be at least 1".to_string(),
+        ));
+    }
+
     // No Python objects are touched below this point, so release the GIL for
     // the (potentially rayon-parallel) pure-Rust conversion work.
     let result = py.detach(|| {
         if parallel {
-            convert_csv_to_xlsx_parallel(&input_path, &output_path, &sheet_name, order)
+            match threads {
+                // A scoped pool rather than the global one, so an explicit
+                // thread count never leaks into later conversions.
+                Some(n) => {
+                    let pool = rayon::ThreadPoolBuilder::new()
+                        .num_threads(n)
+                        .build()
+                        .map_err(|e| {
+                            ConvertError::Config(format!(
+                                "Failed to build thread pool with {} threads: {}",
+                                n, e
+                            ))
+                        })?;
+                    pool.install(|| {
+                        convert_csv_to_xlsx_parallel(&input_path, &output_path, &sheet_name, order)
+                    })
+                }
+                None => convert_csv_to_xlsx_parallel(&input_path, &output_path, &sheet_name, order),
+            }
         } else {
             convert_csv_to_xlsx(&input_path, &output_path, &sheet_name, order)
         }
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import base64
 from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import pytest
 
-from tests.helpers import get_temp_path
+from tests.helpers import TINY_PNG_B64, get_temp_path
 
 
 @pytest.fixture
@@ -52,3 +53,15 @@ def tmp_xlsx_factory() -> Iterator[Callable[[str], str]]:
     yield _make_path
     for path in paths:
         Path(path).unlink(missing_ok=True)
+
+
+@pytest.fixture(scope="session")
+def tiny_png(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Yield the path of a 1x1 PNG decoded and written once per session.
+
+    Image tests only read the file, so one shared copy is safe and saves a
+    base64 decode plus a file write per test.
+    """
+    path = tmp_path_factory.mktemp("assets") / "tiny.png"
+    path.write_bytes(base64.b64decode(TINY_PNG_B64))
+    return str(path)
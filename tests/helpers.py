@@ -29,6 +29,7 @@ __all__ = [
     "active_ws",
     "get_temp_path",
     "load_workbook",
+    "load_workbook_ro",
     "repo_checkout_available",
 ]
 
@@ -67,11 +68,19 @@ def repo_checkout_available() -> bool:
 TINY_PNG_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
 
 
+# Temp files live on tmpfs where one exists: the suite's workbooks are
+# write-then-read-back round-trips, and keeping them in memory removes the
+# disk traffic that otherwise dominates its wall time. Elsewhere (Windows,
+# macOS) this is None and mkstemp falls back to the platform default.
+_TEMP_DIR = "/dev/shm" if Path("/dev/shm").is_dir() else None  # noqa: S108
+
+
 def get_temp_path(suffix: str = ".xlsx") -> str:
     """Return a temporary file path with its handle closed.
 
     The handle is closed immediately so Windows allows the file to be
-    reopened and rewritten by the library under test.
+    reopened and rewritten by the library under test. The file sits on
+    tmpfs when the platform has one.
 
     Args:
         suffix: File extension (including the dot) for the temp path.
@@ -79,11 +88,31 @@ def get_temp_path(suffix: str = ".xlsx") -> str:
     Returns:
         The path to a newly created, empty temporary file.
     """
-    fd, path = tempfile.mkstemp(suffix=suffix)
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=_TEMP_DIR)
     os.close(fd)
     return path
 
 
+def load_workbook_ro(path: str) -> Workbook:
+    """Open ``path`` read-only for cell value and style verification.
+
+    Read-only mode skips materializing a Python object per cell, style, and
+    dimension, which is most of a plain ``load_workbook``'s cost on the tiny
+    workbooks this suite writes. It still resolves per-cell fonts and fills,
+    but exposes neither ``column_dimensions``, ``tables``, comments nor data
+    validations -- verification of those needs the plain loader. Close the
+    returned workbook; read-only keeps the zip handle open.
+
+    Args:
+        path: The workbook to open.
+
+    Returns:
+        The read-only :class:`Workbook`.
+    """
+    assert load_workbook is not None, "openpyxl required"
+    return load_workbook(path, read_only=True, data_only=True, keep_links=False)
+
+
 def active_ws(wb: Workbook) -> Worksheet:
     """Return the active worksheet of ``wb``, asserting one exists.
 
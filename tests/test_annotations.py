@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import closing
 from pathlib import Path
 
 import pandas as pd
@@ -24,14 +25,13 @@ class TestMergedRanges:
             tmp_xlsx,
             merged_ranges=[("A1:C1", "Title Row")],
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Cell A1 should contain the merge text
-        assert ws["A1"].value == "Title Row"
-        # The range should be merged
-        merged = [str(m) for m in ws.merged_cells.ranges]
-        assert "A1:C1" in merged
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Cell A1 should contain the merge text
+            assert ws["A1"].value == "Title Row"
+            # The range should be merged
+            merged = [str(m) for m in ws.merged_cells.ranges]
+            assert "A1:C1" in merged
 
     def test_merge_with_format(self, tmp_xlsx: str) -> None:
         """Merge a range with custom formatting."""
@@ -43,13 +43,12 @@ class TestMergedRanges:
                 ("A1:B1", "Styled Merge", {"bold": True, "bg_color": "#4F81BD"})
             ],
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].value == "Styled Merge"
-        assert ws["A1"].font.bold is True
-        merged = [str(m) for m in ws.merged_cells.ranges]
-        assert "A1:B1" in merged
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].value == "Styled Merge"
+            assert ws["A1"].font.bold is True
+            merged = [str(m) for m in ws.merged_cells.ranges]
+            assert "A1:B1" in merged
 
     def test_multiple_merges(self, tmp_xlsx: str) -> None:
         """Merge multiple ranges in the same sheet."""
@@ -62,12 +61,11 @@ class TestMergedRanges:
                 ("A5:C5", "Bottom Title"),
             ],
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        merged = [str(m) for m in ws.merged_cells.ranges]
-        assert "A1:C1" in merged
-        assert "A5:C5" in merged
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            merged = [str(m) for m in ws.merged_cells.ranges]
+            assert "A1:C1" in merged
+            assert "A5:C5" in merged
 
     def test_merge_with_dfs_to_xlsx(self, tmp_xlsx: str) -> None:
         """Verify merged ranges work per-sheet."""
@@ -76,12 +74,11 @@ class TestMergedRanges:
             [(df, "Sheet1", {"merged_ranges": [("A1:B1", "Per-Sheet Merge")]})],
             tmp_xlsx,
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = wb["Sheet1"]
-        assert ws["A1"].value == "Per-Sheet Merge"
-        merged = [str(m) for m in ws.merged_cells.ranges]
-        assert "A1:B1" in merged
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = wb["Sheet1"]
+            assert ws["A1"].value == "Per-Sheet Merge"
+            merged = [str(m) for m in ws.merged_cells.ranges]
+            assert "A1:B1" in merged
 
 
 class TestHyperlinks:
@@ -95,11 +92,10 @@ class TestHyperlinks:
             tmp_xlsx,
             hyperlinks=[("B2", "https://example.com", "Example Site")],
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["B2"].hyperlink is not None
-        assert "example.com" in ws["B2"].hyperlink.target
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["B2"].hyperlink is not None
+            assert "example.com" in ws["B2"].hyperlink.target
 
     def test_hyperlink_without_display_text(self, tmp_xlsx: str) -> None:
         """Write a hyperlink with URL only (no display text)."""
@@ -110,10 +106,9 @@ class TestHyperlinks:
             hyperlinks=[("A2", "https://example.com")],
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].hyperlink is not None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].hyperlink is not None
 
     def test_multiple_hyperlinks(self, tmp_xlsx: str) -> None:
         """Write multiple hyperlinks in the same sheet."""
@@ -127,12 +122,11 @@ class TestHyperlinks:
                 ("B3", "https://three.com", "Three"),
             ],
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["B1"].hyperlink is not None
-        assert ws["B2"].hyperlink is not None
-        assert ws["B3"].hyperlink is not None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["B1"].hyperlink is not None
+            assert ws["B2"].hyperlink is not None
+            assert ws["B3"].hyperlink is not None
 
     def test_hyperlinks_with_dfs_to_xlsx(self, tmp_xlsx: str) -> None:
         """Verify hyperlinks work per-sheet in multi-sheet mode."""
@@ -147,10 +141,9 @@ class TestHyperlinks:
             ],
             tmp_xlsx,
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = wb["Sheet1"]
-        assert ws["B1"].hyperlink is not None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = wb["Sheet1"]
+            assert ws["B1"].hyperlink is not None
 
 
 class TestComments:
@@ -161,12 +154,11 @@ class TestComments:
         df = pd.DataFrame({"A": [1, 2, 3]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, comments={"A1": "This is a header note"})
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # openpyxl stores comments in ws.comments
-        assert ws["A1"].comment is not None
-        assert "header note" in ws["A1"].comment.text
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # openpyxl stores comments in ws.comments
+            assert ws["A1"].comment is not None
+            assert "header note" in ws["A1"].comment.text
 
     def test_comment_with_author(self, tmp_xlsx: str) -> None:
         """Write a comment with an author."""
@@ -175,13 +167,12 @@ class TestComments:
             df, tmp_xlsx, comments={"A2": {"text": "Data note", "author": "John"}}
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        comment = ws["A2"].comment
-        assert comment is not None
-        assert "Data note" in comment.text
-        assert comment.author == "John"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            comment = ws["A2"].comment
+            assert comment is not None
+            assert "Data note" in comment.text
+            assert comment.author == "John"
 
     def test_comment_dict_unknown_key_raises(self, tmp_xlsx: str) -> None:
         """A typo'd/extra key in the comment dict form is rejected, not silently dropped."""
@@ -197,13 +188,12 @@ class TestComments:
             df, tmp_xlsx, comments={"A1": "Column A", "B1": "Column B", "A2": "First value"}
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].comment is not None
-        assert ws["B1"].comment is not None
-        assert ws["A2"].comment is not None
-        assert "Column A" in ws["A1"].comment.text
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].comment is not None
+            assert ws["B1"].comment is not None
+            assert ws["A2"].comment is not None
+            assert "Column A" in ws["A1"].comment.text
 
     def test_empty_per_sheet_comments_overrides_global(self, tmp_xlsx: str) -> None:
         """An explicitly empty per-sheet 'comments' dict disables the global default for that sheet.
@@ -222,10 +212,9 @@ class TestComments:
             tmp_xlsx,
             comments={"A1": "note"},
         )
-        wb = load_workbook(tmp_xlsx)
-        assert wb["S1"]["A1"].comment is not None
-        assert wb["S2"]["A1"].comment is None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            assert wb["S1"]["A1"].comment is not None
+            assert wb["S2"]["A1"].comment is None
 
 
 class TestDefinedNames:
@@ -236,11 +225,10 @@ class TestDefinedNames:
         df = pd.DataFrame({"a": [1, 2, 3]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx,
             defined_names={"MyRange": "=Sheet1!$A$1:$A$4"})
-        wb = load_workbook(tmp_xlsx)
-        names = {dn.name: dn.attr_text for dn in wb.defined_names.values()}
-        assert "MyRange" in names
-        assert "$A$1:$A$4" in names["MyRange"]
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            names = {dn.name: dn.attr_text for dn in wb.defined_names.values()}
+            assert "MyRange" in names
+            assert "$A$1:$A$4" in names["MyRange"]
 
     def test_multiple_defined_names(self, tmp_xlsx: str) -> None:
         """Create multiple defined names."""
@@ -249,11 +237,10 @@ class TestDefinedNames:
             "Range1": "=Sheet1!$A$1:$A$2",
             "Range2": "=Sheet1!$B$1:$B$2",
         })
-        wb = load_workbook(tmp_xlsx)
-        names = {dn.name for dn in wb.defined_names.values()}
-        assert "Range1" in names
-        assert "Range2" in names
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            names = {dn.name for dn in wb.defined_names.values()}
+            assert "Range1" in names
+            assert "Range2" in names
 
     def test_defined_names_dfs_to_xlsx(self, tmp_xlsx: str) -> None:
         """Verify defined_names works in multi-sheet mode."""
@@ -262,10 +249,9 @@ class TestDefinedNames:
         xlsxturbo.dfs_to_xlsx(
             [(df1, "S1"), (df2, "S2")], tmp_xlsx,
             defined_names={"AllData": "=S1!$A$1:$A$2"})
-        wb = load_workbook(tmp_xlsx)
-        names = {dn.name for dn in wb.defined_names.values()}
-        assert "AllData" in names
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            names = {dn.name for dn in wb.defined_names.values()}
+            assert "AllData" in names
 
     def test_defined_name_with_quoted_sheet(self, tmp_xlsx: str) -> None:
         """Create a defined name with a quoted sheet name containing a space."""
@@ -273,10 +259,9 @@ class TestDefinedNames:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx,
             sheet_name="LCA Calculator Parameters",
             defined_names={"Settings": "='LCA Calculator Parameters'!$B$13:$D$155"})
-        wb = load_workbook(tmp_xlsx)
-        names = {dn.name for dn in wb.defined_names.values()}
-        assert "Settings" in names
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            names = {dn.name for dn in wb.defined_names.values()}
+            assert "Settings" in names
 
     def test_empty_local_defined_name_raises_df_to_xlsx(self, tmp_xlsx: str) -> None:
         """Empty local defined names raise ValueError instead of panicking."""
@@ -309,9 +294,8 @@ class TestDefinedNamesVerification:
             df, tmp_xlsx,
             defined_names={"MyRange": "=Sheet1!$A$1:$A$4"},
         )
-        wb = load_workbook(tmp_xlsx)
-        assert "MyRange" in wb.defined_names
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            assert "MyRange" in wb.defined_names
 
     def test_defined_names_multi_sheet(self, tmp_xlsx: str) -> None:
         """Verify defined_names work with dfs_to_xlsx."""
@@ -320,6 +304,5 @@ class TestDefinedNamesVerification:
             [(df, "Data")], tmp_xlsx,
             defined_names={"Total": "=Data!$A$1:$A$3"},
         )
-        wb = load_workbook(tmp_xlsx)
-        assert "Total" in wb.defined_names
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            assert "Total" in wb.defined_names
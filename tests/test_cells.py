@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from contextlib import closing
+
 import pandas as pd
 import polars as pl
 import pytest
 import xlsxturbo
 
-from tests.helpers import HAS_OPENPYXL, active_ws, load_workbook
+from tests.helpers import HAS_OPENPYXL, active_ws, load_workbook_ro
 
 pytestmark = pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl required for content verification")
 
@@ -19,26 +21,23 @@ class TestCells:
         """Write a string to a specific cell."""
         df = pd.DataFrame({"a": [1, 2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={"C1": "hello"})
-        wb = load_workbook(tmp_xlsx)
-        assert active_ws(wb)["C1"].value == "hello"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            assert active_ws(wb)["C1"].value == "hello"
 
     def test_numeric_cells(self, tmp_xlsx: str) -> None:
         """Write int and float to cells."""
         df = pd.DataFrame({"a": [1]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={"B5": 42, "C5": 3.14})
-        wb = load_workbook(tmp_xlsx)
-        assert active_ws(wb)["B5"].value == 42
-        assert abs(active_ws(wb)["C5"].value - 3.14) < 0.001
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            assert active_ws(wb)["B5"].value == 42
+            assert abs(active_ws(wb)["C5"].value - 3.14) < 0.001
 
     def test_bool_cell(self, tmp_xlsx: str) -> None:
         """Write a boolean to a cell."""
         df = pd.DataFrame({"a": [1]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={"B2": True})
-        wb = load_workbook(tmp_xlsx)
-        assert active_ws(wb)["B2"].value is True
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            assert active_ws(wb)["B2"].value is True
 
     def test_cell_with_num_format(self, tmp_xlsx: str) -> None:
         """Dict-style cell with num_format preserves text format."""
@@ -46,19 +45,17 @@ class TestCells:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={
             "D6": {"value": "934728173849", "num_format": "@"}
         })
-        wb = load_workbook(tmp_xlsx)
-        cell = active_ws(wb)["D6"]
-        assert cell.value == "934728173849"
-        assert cell.number_format == "@"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            cell = active_ws(wb)["D6"]
+            assert cell.value == "934728173849"
+            assert cell.number_format == "@"
 
     def test_cell_overwrites_dataframe_data(self, tmp_xlsx: str) -> None:
         """Cells parameter overwrites existing DataFrame values."""
         df = pd.DataFrame({"a": ["original"]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={"A2": "overwritten"})
-        wb = load_workbook(tmp_xlsx)
-        assert active_ws(wb)["A2"].value == "overwritten"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            assert active_ws(wb)["A2"].value == "overwritten"
 
     def test_cell_dict_missing_value_key(self, tmp_xlsx: str) -> None:
         """Dict-style cell without 'value' key raises ValueError."""
@@ -89,10 +86,9 @@ class TestCells:
         xlsxturbo.dfs_to_xlsx(
             [(df1, "S1"), (df2, "S2", {"cells": {"C1": "per-sheet"}})],
             tmp_xlsx, cells={"C1": "global"})
-        wb = load_workbook(tmp_xlsx)
-        assert wb["S1"]["C1"].value == "global"
-        assert wb["S2"]["C1"].value == "per-sheet"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            assert wb["S1"]["C1"].value == "global"
+            assert wb["S2"]["C1"].value == "per-sheet"
 
     def test_num_format_wrong_type_raises(self, tmp_xlsx: str) -> None:
         """Non-string num_format raises TypeError."""
@@ -106,9 +102,8 @@ class TestCells:
         """Cells work with polars DataFrames."""
         df = pl.DataFrame({"a": [1, 2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={"C1": "extra"})
-        wb = load_workbook(tmp_xlsx)
-        assert active_ws(wb)["C1"].value == "extra"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            assert active_ws(wb)["C1"].value == "extra"
 
 
 class TestCellsPerSheet:
@@ -122,12 +117,11 @@ class TestCellsPerSheet:
             (df1, "Sheet1", {"cells": {"C1": "note1", "C2": 100}}),
             (df2, "Sheet2", {"cells": {"C1": "note2"}}),
         ], tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        assert wb["Sheet1"]["C1"].value == "note1"
-        assert wb["Sheet1"]["C2"].value == 100
-        assert wb["Sheet2"]["C1"].value == "note2"
-        assert wb["Sheet2"]["C2"].value is None
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            assert wb["Sheet1"]["C1"].value == "note1"
+            assert wb["Sheet1"]["C2"].value == 100
+            assert wb["Sheet2"]["C1"].value == "note2"
+            assert wb["Sheet2"]["C2"].value is None
 
     def test_cells_per_sheet_overrides_global(self, tmp_xlsx: str) -> None:
         """Per-sheet cells replace (not merge with) global cells."""
@@ -137,13 +131,12 @@ class TestCellsPerSheet:
             (df1, "S1"),
             (df2, "S2", {"cells": {"D1": "override"}}),
         ], tmp_xlsx, cells={"C1": "global"})
-        wb = load_workbook(tmp_xlsx)
-        # S1 gets global cells
-        assert wb["S1"]["C1"].value == "global"
-        # S2 gets per-sheet cells (override replaces global)
-        assert wb["S2"]["D1"].value == "override"
-        assert wb["S2"]["C1"].value is None
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            # S1 gets global cells
+            assert wb["S1"]["C1"].value == "global"
+            # S2 gets per-sheet cells (override replaces global)
+            assert wb["S2"]["D1"].value == "override"
+            assert wb["S2"]["C1"].value is None
 
     def test_cells_per_sheet_with_num_format(self, tmp_xlsx: str) -> None:
         """Per-sheet cells with num_format via SheetOptions."""
@@ -153,11 +146,10 @@ class TestCellsPerSheet:
                 "C1": {"value": "12345", "num_format": "@"}
             }}),
         ], tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        cell = wb["S1"]["C1"]
-        assert str(cell.value) == "12345"
-        assert cell.number_format == "@"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            cell = wb["S1"]["C1"]
+            assert str(cell.value) == "12345"
+            assert cell.number_format == "@"
 
     def test_cells_per_sheet_with_alignment(self, tmp_xlsx: str) -> None:
         """Per-sheet cells with alignment via SheetOptions."""
@@ -167,11 +159,10 @@ class TestCellsPerSheet:
                 "C1": {"value": "centered", "align_horizontal": "center"}
             }}),
         ], tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        cell = wb["S1"]["C1"]
-        assert cell.value == "centered"
-        assert cell.alignment.horizontal == "center"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            cell = wb["S1"]["C1"]
+            assert cell.value == "centered"
+            assert cell.alignment.horizontal == "center"
 
 
 class TestCellsFormatting:
@@ -183,11 +174,10 @@ class TestCellsFormatting:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={
             "C1": {"value": "right-aligned", "align_horizontal": "right"}
         })
-        wb = load_workbook(tmp_xlsx)
-        cell = active_ws(wb)["C1"]
-        assert cell.value == "right-aligned"
-        assert cell.alignment.horizontal == "right"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            cell = active_ws(wb)["C1"]
+            assert cell.value == "right-aligned"
+            assert cell.alignment.horizontal == "right"
 
     def test_cells_with_vertical_alignment(self, tmp_xlsx: str) -> None:
         """Write cells with align_vertical."""
@@ -195,11 +185,10 @@ class TestCellsFormatting:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={
             "C1": {"value": "top", "align_vertical": "top"}
         })
-        wb = load_workbook(tmp_xlsx)
-        cell = active_ws(wb)["C1"]
-        assert cell.value == "top"
-        assert cell.alignment.vertical == "top"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            cell = active_ws(wb)["C1"]
+            assert cell.value == "top"
+            assert cell.alignment.vertical == "top"
 
     def test_cells_with_wrap_text(self, tmp_xlsx: str) -> None:
         """Write cells with wrap_text."""
@@ -207,11 +196,10 @@ class TestCellsFormatting:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={
             "C1": {"value": "long text here", "wrap_text": True}
         })
-        wb = load_workbook(tmp_xlsx)
-        cell = active_ws(wb)["C1"]
-        assert cell.value == "long text here"
-        assert cell.alignment.wrapText is True
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            cell = active_ws(wb)["C1"]
+            assert cell.value == "long text here"
+            assert cell.alignment.wrapText is True
 
     def test_cells_with_combined_formatting(self, tmp_xlsx: str) -> None:
         """Write cells with num_format + alignment + wrap_text together."""
@@ -225,13 +213,12 @@ class TestCellsFormatting:
                 "wrap_text": True
             }
         })
-        wb = load_workbook(tmp_xlsx)
-        cell = active_ws(wb)["C1"]
-        assert cell.number_format == "0.00%"
-        assert cell.alignment.horizontal == "center"
-        assert cell.alignment.vertical == "top"
-        assert cell.alignment.wrapText is True
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            cell = active_ws(wb)["C1"]
+            assert cell.number_format == "0.00%"
+            assert cell.alignment.horizontal == "center"
+            assert cell.alignment.vertical == "top"
+            assert cell.alignment.wrapText is True
 
     def test_cells_formatting_with_polars(self, tmp_xlsx: str) -> None:
         """Cells formatting works with polars DataFrames."""
@@ -239,8 +226,7 @@ class TestCellsFormatting:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={
             "C1": {"value": "test", "align_horizontal": "center"}
         })
-        wb = load_workbook(tmp_xlsx)
-        cell = active_ws(wb)["C1"]
-        assert cell.value == "test"
-        assert cell.alignment.horizontal == "center"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            cell = active_ws(wb)["C1"]
+            assert cell.value == "test"
+            assert cell.alignment.horizontal == "center"
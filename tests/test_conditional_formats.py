@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import zipfile
+from contextlib import closing
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -133,11 +134,10 @@ class TestConditionalFormatting:
             },
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Should have conditional formats on both score columns
-        assert len(ws.conditional_formatting) >= 1
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Should have conditional formats on both score columns
+            assert len(ws.conditional_formatting) >= 1
 
     def test_conditional_format_pattern_must_match(self, tmp_xlsx: str) -> None:
         """Conditional-format patterns that match no columns raise an error."""
@@ -255,14 +255,13 @@ class TestCellConditionalFormat:
             tmp_xlsx,
             conditional_formats={"A": config},
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cf_rules = ws.conditional_formatting
-        rule = next(iter(cf_rules)).rules[0]
-        assert rule.type == expected_type
-        assert rule.operator == expected_operator
-        assert rule.formula == expected_formula
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cf_rules = ws.conditional_formatting
+            rule = next(iter(cf_rules)).rules[0]
+            assert rule.type == expected_type
+            assert rule.operator == expected_operator
+            assert rule.formula == expected_formula
 
     def test_cell_multiple_rules_list(self, tmp_xlsx: str) -> None:
         """Verify multiple rules on one column via list."""
@@ -371,16 +370,15 @@ class TestCellConditionalFormat:
                 "format": {"bg_color": "#00FF00"}
             }
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cf_rules = ws.conditional_formatting
-        assert len(list(cf_rules)) > 0
-        rule = next(iter(cf_rules))
-        cf = rule.rules[0]
-        assert cf.type == "cellIs"
-        assert cf.operator == "greaterThan"
-        assert cf.formula == ['70']
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cf_rules = ws.conditional_formatting
+            assert len(list(cf_rules)) > 0
+            rule = next(iter(cf_rules))
+            cf = rule.rules[0]
+            assert cf.type == "cellIs"
+            assert cf.operator == "greaterThan"
+            assert cf.formula == ['70']
 
     def test_cell_string_comparison_correct(self, tmp_xlsx: str) -> None:
         """Verify string values produce string comparisons in Excel."""
@@ -393,16 +391,15 @@ class TestCellConditionalFormat:
                 "format": {"bg_color": "#FF0000"}
             }
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cf_rules = ws.conditional_formatting
-        assert len(list(cf_rules)) > 0
-        rule = next(iter(cf_rules))
-        cf = rule.rules[0]
-        assert cf.type == "cellIs"
-        assert cf.operator == "equal"
-        assert cf.formula == ['"ERROR"']
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cf_rules = ws.conditional_formatting
+            assert len(list(cf_rules)) > 0
+            rule = next(iter(cf_rules))
+            cf = rule.rules[0]
+            assert cf.type == "cellIs"
+            assert cf.operator == "equal"
+            assert cf.formula == ['"ERROR"']
 
     def test_invalid_list_item_raises(self, tmp_xlsx: str) -> None:
         """Verify non-dict item in conditional format list raises TypeError."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import warnings
+from contextlib import closing
 
 import pandas as pd
 import pytest
@@ -22,12 +23,11 @@ class TestConstantMemoryMode:
         rows, cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx, constant_memory=True)
         assert rows > 0
         assert cols == 2
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].value == "A"  # header
-        assert ws["A2"].value == 0  # first data row
-        assert ws["B2"].value == 100
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].value == "A"  # header
+            assert ws["A2"].value == 0  # first data row
+            assert ws["B2"].value == 100
 
     def test_constant_memory_warns_when_disabling_features(self, tmp_xlsx: str) -> None:
         """Features are disabled with one actionable warning and no crash."""
@@ -50,25 +50,23 @@ class TestConstantMemoryMode:
                 rich_text={"B1": [("Bold", {"bold": True})]},
             )
         assert rows > 0
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Table should NOT be created
-        assert len(ws.tables) == 0
-        # Data should still be written
-        assert ws["A1"].value == "Score"
-        assert ws["A2"].value == 1
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Table should NOT be created
+            assert len(ws.tables) == 0
+            # Data should still be written
+            assert ws["A1"].value == "Score"
+            assert ws["A2"].value == 1
 
     def test_constant_memory_with_column_widths(self, tmp_xlsx: str) -> None:
         """Column widths still work in constant memory mode."""
         df = pd.DataFrame({"A": [1], "B": [2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, constant_memory=True, column_widths={0: 25})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        width = ws.column_dimensions["A"].width
-        assert width is not None
-        assert width > 20
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            width = ws.column_dimensions["A"].width
+            assert width is not None
+            assert width > 20
 
 
 class TestConstantMemoryWarning:
@@ -149,12 +147,11 @@ class TestConstantMemoryWarning:
                 assert "table_style" in str(warning.message)
             assert any("'S1'" in message for message in messages)
             assert any("'S2'" in message for message in messages)
-        wb = load_workbook(tmp_xlsx)
-        assert wb["S1"]["A2"].value == 1
-        assert wb["S2"]["A2"].value == 3
-        assert len(wb["S1"].tables) == 0
-        assert len(wb["S2"].tables) == 0
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            assert wb["S1"]["A2"].value == 1
+            assert wb["S2"]["A2"].value == 3
+            assert len(wb["S1"].tables) == 0
+            assert len(wb["S2"].tables) == 0
 
 
 class TestFeatureConstantMemoryWarnings:
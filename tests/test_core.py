@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import csv
 from collections.abc import Callable
+from contextlib import closing
+from datetime import datetime
 from pathlib import Path
 from typing import ClassVar
 
@@ -12,11 +15,39 @@ import polars as pl
 import pytest
 import xlsxturbo
 
-from tests.helpers import HAS_OPENPYXL, active_ws, load_workbook
+from tests.helpers import HAS_OPENPYXL, active_ws, load_workbook, load_workbook_ro
 
 pytestmark = pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl required for content verification")
 
 
+@pytest.fixture(scope="module")
+def ambiguous_date_csv(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Yield a CSV whose date is ambiguous between month-first and day-first.
+
+    Shared by the US and EU date-order tests, which read the same input and
+    differ only in the ``date_order`` they pass.
+    """
+    path = tmp_path_factory.mktemp("csv") / "ambiguous_date.csv"
+    path.write_text("date,value\n01-02-2024,100\n")
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def hundred_row_csv(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Yield a 100-row CSV written once for the parallel-conversion tests.
+
+    The conversions only read the file, so the parallel tests can share one
+    copy instead of each rebuilding the identical input.
+    """
+    path = tmp_path_factory.mktemp("csv") / "hundred_rows.csv"
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["num", "text"])
+        for i in range(100):
+            writer.writerow([str(i), f"row_{i}"])
+    return str(path)
+
+
 class TestBackwardCompatibility:
     """Ensure existing functionality still works."""
 
@@ -25,20 +56,18 @@ class TestBackwardCompatibility:
         df = pd.DataFrame({"A": [1], "B": [2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_widths={0: 20, 1: 30})
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws.column_dimensions["A"].width > 15
-        assert ws.column_dimensions["B"].width > 25
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws.column_dimensions["A"].width > 15
+            assert ws.column_dimensions["B"].width > 25
 
     def test_table_style_without_table_name(self, tmp_xlsx: str) -> None:
         """table_style works without table_name (existing behavior)."""
         df = pd.DataFrame({"A": [1, 2, 3]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, table_style="Medium9")
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert len(ws.tables) == 1
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert len(ws.tables) == 1
 
 
 class TestPolarsSupport:
@@ -49,10 +78,9 @@ class TestPolarsSupport:
         df = pl.DataFrame({"A": ["x" * 100], "B": ["y" * 100]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_widths={"_all": 20})
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws.column_dimensions["A"].width <= 21
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws.column_dimensions["A"].width <= 21
 
     def test_polars_datetime_fractional_seconds(self, tmp_xlsx: str) -> None:
         """Polars datetime columns write as Excel datetimes.
@@ -61,34 +89,29 @@ class TestPolarsSupport:
         hits the "datetime" branch of write_py_value_with_format -- a distinct
         path from the pandas datetime64/Timestamp branches.
         """
-        from datetime import datetime
-
         df = pl.DataFrame({"t": [datetime(2024, 1, 1, 12, 34, 56, 789000)]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == datetime(2024, 1, 1, 12, 34, 56, 789000)
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == datetime(2024, 1, 1, 12, 34, 56, 789000)
 
     def test_polars_table_name(self, tmp_xlsx: str) -> None:
         """Polars DataFrame with a custom table name creates that table."""
         df = pl.DataFrame({"A": [1, 2, 3]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, table_style="Medium2", table_name="PolarsTable")
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert "PolarsTable" in ws.tables
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert "PolarsTable" in ws.tables
 
     def test_polars_header_format(self, tmp_xlsx: str) -> None:
         """Polars DataFrame honors header_format."""
         df = pl.DataFrame({"A": [1], "B": [2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, header_format={"bold": True})
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].font.bold is True
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].font.bold is True
 
 
 class TestBooleanDtype:
@@ -106,26 +129,24 @@ class TestBooleanDtype:
         df = pd.DataFrame({"flag": [True, False]})
         assert df["flag"].dtype == bool
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].data_type == "b"
-        assert ws["A2"].value is True
-        assert ws["A3"].data_type == "b"
-        assert ws["A3"].value is False
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].data_type == "b"
+            assert ws["A2"].value is True
+            assert ws["A3"].data_type == "b"
+            assert ws["A3"].value is False
 
     def test_polars_boolean_column_writes_excel_booleans(self, tmp_xlsx: str) -> None:
         """A polars DataFrame with a Boolean column writes real Excel booleans."""
         df = pl.DataFrame({"flag": [True, False]})
         assert df["flag"].dtype == pl.Boolean
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].data_type == "b"
-        assert ws["A2"].value is True
-        assert ws["A3"].data_type == "b"
-        assert ws["A3"].value is False
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].data_type == "b"
+            assert ws["A2"].value is True
+            assert ws["A3"].data_type == "b"
+            assert ws["A3"].value is False
 
     def test_mixed_dtype_dataframe_bool_column_still_writes_booleans(self, tmp_xlsx: str) -> None:
         """A mixed-dtype DataFrame's bool column still writes real Excel booleans.
@@ -137,13 +158,12 @@ class TestBooleanDtype:
         """
         df = pd.DataFrame({"flag": [True, False], "count": [1, 2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].data_type == "b"
-        assert ws["A2"].value is True
-        assert ws["A3"].data_type == "b"
-        assert ws["A3"].value is False
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].data_type == "b"
+            assert ws["A2"].value is True
+            assert ws["A3"].data_type == "b"
+            assert ws["A3"].value is False
 
 
 class TestEdgeCases:
@@ -171,11 +191,10 @@ class TestEdgeCases:
         df = pd.DataFrame({"A": [], "B": []})
         _rows, _cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx, table_style="Medium2")
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # No table should be created for empty DataFrame
-        assert len(ws.tables) == 0
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # No table should be created for empty DataFrame
+            assert len(ws.tables) == 0
 
     def test_invalid_table_style_raises_error(self, tmp_xlsx: str) -> None:
         """Invalid table_style raises ValueError."""
@@ -205,14 +224,13 @@ class TestEdgeCases:
             },
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # price_usd should be red (specific match)
-        assert ws["A2"].fill.fgColor.rgb == "FFFF0000"
-        # price_eur should be blue (wildcard match)
-        assert ws["B2"].fill.fgColor.rgb == "FF0000FF"
-        # other should have no background
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # price_usd should be red (specific match)
+            assert ws["A2"].fill.fgColor.rgb == "FFFF0000"
+            # price_eur should be blue (wildcard match)
+            assert ws["B2"].fill.fgColor.rgb == "FF0000FF"
+            # other should have no background
 
     def test_empty_dataframe_no_header(self, tmp_xlsx: str) -> None:
         """Empty DataFrame with header=False."""
@@ -227,10 +245,9 @@ class TestEdgeCases:
         df = pd.DataFrame({"A": [1, 2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, header=False, table_style="Medium2")
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].value == 1  # data in row 1, no header
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].value == 1  # data in row 1, no header
 
     def test_dfs_per_sheet_header_false_with_global_table_style(self, tmp_xlsx: str) -> None:
         """Per-sheet header=False skips table even with global table_style."""
@@ -241,86 +258,58 @@ class TestEdgeCases:
             (df2, "NoHeader", {"header": False}),
         ], tmp_xlsx, table_style="Medium2")
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        # WithHeader sheet should have table
-        assert wb["WithHeader"]["A1"].value == "A"
-        # NoHeader sheet should have data in row 1
-        assert wb["NoHeader"]["A1"].value == 2
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            # WithHeader sheet should have table
+            assert wb["WithHeader"]["A1"].value == "A"
+            # NoHeader sheet should have data in row 1
+            assert wb["NoHeader"]["A1"].value == 2
 
 
 class TestDateOrder:
     """Tests for date_order parameter in csv_to_xlsx."""
 
-    def test_date_order_us_parses_mdy(self, tmp_xlsx_factory: Callable[..., str]) -> None:
+    def test_date_order_us_parses_mdy(
+        self, tmp_xlsx: str, ambiguous_date_csv: str
+    ) -> None:
         """US date order parses 01-02-2024 as January 2."""
-        import csv
-        from datetime import datetime
-
-        # Create CSV with ambiguous date
-        csv_path = tmp_xlsx_factory(".csv")
-        xlsx_path = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["date", "value"])
-            writer.writerow(["01-02-2024", "100"])
-
-        xlsxturbo.csv_to_xlsx(csv_path, xlsx_path, date_order="us")
-
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        cell_value = ws["A2"].value
-        # openpyxl returns datetime objects for Excel dates
-        assert isinstance(cell_value, datetime), f"Expected datetime, got {type(cell_value)}"
-        # US format: 01-02-2024 = January 2, 2024
-        assert cell_value.month == 1, f"Expected January (1), got month {cell_value.month}"
-        assert cell_value.day == 2, f"Expected day 2, got day {cell_value.day}"
-        wb.close()
-
-    def test_date_order_eu_parses_dmy(self, tmp_xlsx_factory: Callable[..., str]) -> None:
+        xlsxturbo.csv_to_xlsx(ambiguous_date_csv, tmp_xlsx, date_order="us")
+
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell_value = ws["A2"].value
+            # openpyxl returns datetime objects for Excel dates
+            assert isinstance(cell_value, datetime), f"Expected datetime, got {type(cell_value)}"
+            # US format: 01-02-2024 = January 2, 2024
+            assert cell_value.month == 1, f"Expected January (1), got month {cell_value.month}"
+            assert cell_value.day == 2, f"Expected day 2, got day {cell_value.day}"
+
+    def test_date_order_eu_parses_dmy(
+        self, tmp_xlsx: str, ambiguous_date_csv: str
+    ) -> None:
         """European date order parses 01-02-2024 as February 1."""
-        import csv
-        from datetime import datetime
-
-        csv_path = tmp_xlsx_factory(".csv")
-        xlsx_path = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["date", "value"])
-            writer.writerow(["01-02-2024", "100"])
-
-        xlsxturbo.csv_to_xlsx(csv_path, xlsx_path, date_order="eu")
+        xlsxturbo.csv_to_xlsx(ambiguous_date_csv, tmp_xlsx, date_order="eu")
 
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        cell_value = ws["A2"].value
-        assert isinstance(cell_value, datetime), f"Expected datetime, got {type(cell_value)}"
-        # EU format: 01-02-2024 = February 1, 2024
-        assert cell_value.month == 2, f"Expected February (2), got month {cell_value.month}"
-        assert cell_value.day == 1, f"Expected day 1, got day {cell_value.day}"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell_value = ws["A2"].value
+            assert isinstance(cell_value, datetime), f"Expected datetime, got {type(cell_value)}"
+            # EU format: 01-02-2024 = February 1, 2024
+            assert cell_value.month == 2, f"Expected February (2), got month {cell_value.month}"
+            assert cell_value.day == 1, f"Expected day 1, got day {cell_value.day}"
 
     def test_date_order_produces_different_results(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """US and EU date orders produce different Excel dates for ambiguous input."""
-        import csv
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_us = tmp_xlsx_factory()
         xlsx_eu = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["date"])
-            writer.writerow(["03-04-2024"])  # Mar 4 (US) vs Apr 3 (EU)
+        Path(csv_path).write_text("date\n03-04-2024\n")  # Mar 4 (US) vs Apr 3 (EU)
 
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_us, date_order="us")
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_eu, date_order="eu")
 
-        wb_us = load_workbook(xlsx_us)
-        wb_eu = load_workbook(xlsx_eu)
-        us_value = active_ws(wb_us)["A2"].value
-        eu_value = active_ws(wb_eu)["A2"].value
-        wb_us.close()
-        wb_eu.close()
+        with closing(load_workbook_ro(xlsx_us)) as wb_us, closing(load_workbook_ro(xlsx_eu)) as wb_eu:
+            us_value = active_ws(wb_us)["A2"].value
+            eu_value = active_ws(wb_eu)["A2"].value
 
         # Values should be different dates
         assert us_value != eu_value, "US and EU should produce different dates"
@@ -330,14 +319,9 @@ class TestDateOrder:
 
     def test_invalid_date_order_raises(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """Invalid date_order raises ValueError."""
-        import csv
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["a"])
-            writer.writerow(["1"])
+        Path(csv_path).write_text("a\n1\n")
 
         with pytest.raises(ValueError, match=r"(?i)invalid") as exc_info:
             xlsxturbo.csv_to_xlsx(csv_path, xlsx_path, date_order="invalid")  # type: ignore[arg-type]  # invalid on purpose
@@ -352,91 +336,63 @@ class TestCsvConversion:
 
     def test_basic_csv(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """Basic CSV with header and data rows."""
-        import csv
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["name", "age", "score"])
-            writer.writerow(["Alice", "30", "95.5"])
-            writer.writerow(["Bob", "25", "88.0"])
+        Path(csv_path).write_text("name,age,score\nAlice,30,95.5\nBob,25,88.0\n")
 
         rows, cols = xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
         assert rows == 3
         assert cols == 3
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        assert ws["A1"].value == "name"
-        assert ws["B2"].value == 30  # should be detected as integer
-        assert ws["C2"].value == 95.5  # should be detected as float
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].value == "name"
+            assert ws["B2"].value == 30  # should be detected as integer
+            assert ws["C2"].value == 95.5  # should be detected as float
 
     def test_csv_type_detection(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """CSV type detection: int, float, bool, date, string."""
-        import csv
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["int", "float", "bool", "date", "text"])
-            writer.writerow(["42", "3.14", "true", "2024-01-15", "hello"])
+        Path(csv_path).write_text("int,float,bool,date,text\n42,3.14,true,2024-01-15,hello\n")
 
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        assert ws["A2"].value == 42
-        assert abs(ws["B2"].value - 3.14) < 0.001
-        assert ws["C2"].value is True
-        # Date should be a datetime object in openpyxl
-        from datetime import datetime
-
-        assert isinstance(ws["D2"].value, datetime)
-        assert ws["E2"].value == "hello"
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == 42
+            assert abs(ws["B2"].value - 3.14) < 0.001
+            assert ws["C2"].value is True
+            # Date should be a datetime object in openpyxl
+
+            assert isinstance(ws["D2"].value, datetime)
+            assert ws["E2"].value == "hello"
 
     def test_csv_datetime_fractional_seconds(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """CSV datetime values preserve fractional seconds in Excel serials."""
-        import csv
-        from datetime import datetime
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["timestamp"])
-            writer.writerow(["2024-01-01T12:34:56.789"])
+        Path(csv_path).write_text("timestamp\n2024-01-01T12:34:56.789\n")
 
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        value = ws["A2"].value
-        assert isinstance(value, datetime)
-        assert value == datetime(2024, 1, 1, 12, 34, 56, 789000)
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            value = ws["A2"].value
+            assert isinstance(value, datetime)
+            assert value == datetime(2024, 1, 1, 12, 34, 56, 789000)
 
     def test_csv_special_values(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """CSV with NaN, Inf, empty cells."""
-        import csv
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["a", "b", "c"])
-            writer.writerow(["NaN", "Inf", ""])
-            writer.writerow(["nan", "-Inf", "   "])
+        Path(csv_path).write_text("a,b,c\nNaN,Inf,\nnan,-Inf,   \n")
 
         rows, _cols = xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
         assert rows == 3
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        # NaN/Inf/empty all become empty cells (write_cell -> CellValue::Empty
-        # writes an empty string, which openpyxl reads back as None or "").
-        for ref in ("A2", "B2", "C2", "A3", "B3", "C3"):
-            assert ws[ref].value in (None, ""), f"{ref} should be empty"
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            # NaN/Inf/empty all become empty cells (write_cell -> CellValue::Empty
+            # writes an empty string, which openpyxl reads back as None or "").
+            for ref in ("A2", "B2", "C2", "A3", "B3", "C3"):
+                assert ws[ref].value in (None, ""), f"{ref} should be empty"
 
     def test_csv_string_cells_preserve_surrounding_whitespace(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """String cells keep leading/trailing whitespace; type detection still trims to classify.
@@ -447,8 +403,6 @@ class TestCsvConversion:
         written as a number (detection trims a private copy, but the original
         untrimmed value is what a genuine string falls back to).
         """
-        import csv
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
         with Path(csv_path).open("w", newline="") as f:
@@ -457,11 +411,10 @@ class TestCsvConversion:
             writer.writerow([" padded ", " 123 "])
 
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        assert ws["A2"].value == " padded "
-        assert ws["B2"].value == 123
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == " padded "
+            assert ws["B2"].value == 123
 
     def test_csv_int_min_writes_as_string_without_overflow(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """i64::MIN via the CSV path (write_cell) is written as text, no overflow.
@@ -469,64 +422,73 @@ class TestCsvConversion:
         Complements test_i64_min_writes_as_string_without_overflow, which covers
         the distinct DataFrame write_int path.
         """
-        import csv as _csv
-
         int_min = -9223372036854775808  # i64::MIN
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
         with Path(csv_path).open("w", newline="") as f:
-            w = _csv.writer(f)
+            w = csv.writer(f)
             w.writerow(["n"])
             w.writerow([str(int_min)])
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        assert ws["A2"].value == str(int_min)
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == str(int_min)
 
-    def test_csv_parallel(self, tmp_xlsx_factory: Callable[..., str]) -> None:
+    def test_csv_parallel(self, tmp_xlsx_factory: Callable[..., str], hundred_row_csv: str) -> None:
         """CSV parallel mode produces same output."""
-        import csv
-
-        csv_path = tmp_xlsx_factory(".csv")
         xlsx_seq = tmp_xlsx_factory()
         xlsx_par = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["num", "text"])
-            for i in range(100):
-                writer.writerow([str(i), f"row_{i}"])
 
-        rows_s, cols_s = xlsxturbo.csv_to_xlsx(csv_path, xlsx_seq, parallel=False)
-        rows_p, cols_p = xlsxturbo.csv_to_xlsx(csv_path, xlsx_par, parallel=True)
+        rows_s, cols_s = xlsxturbo.csv_to_xlsx(hundred_row_csv, xlsx_seq, parallel=False)
+        rows_p, cols_p = xlsxturbo.csv_to_xlsx(hundred_row_csv, xlsx_par, parallel=True)
         assert rows_s == rows_p
         assert cols_s == cols_p
-        wb_s = load_workbook(xlsx_seq)
-        wb_p = load_workbook(xlsx_par)
-        ws_s = active_ws(wb_s)
-        ws_p = active_ws(wb_p)
-        # Spot check some cells match
-        for row in [1, 2, 50, 101]:
-            assert ws_s[f"A{row}"].value == ws_p[f"A{row}"].value
-            assert ws_s[f"B{row}"].value == ws_p[f"B{row}"].value
-        wb_s.close()
-        wb_p.close()
+        with closing(load_workbook_ro(xlsx_seq)) as wb_s, closing(load_workbook_ro(xlsx_par)) as wb_p:
+            # One streaming pass over each sheet compares every cell, not a sample.
+            seq_rows = active_ws(wb_s).iter_rows(values_only=True)
+            par_rows = active_ws(wb_p).iter_rows(values_only=True)
+            assert list(seq_rows) == list(par_rows)
+
+    def test_csv_parallel_threads(self, tmp_xlsx_factory: Callable[..., str], hundred_row_csv: str) -> None:
+        """An explicit thread count produces the same output as the default pool."""
+        xlsx_default = tmp_xlsx_factory()
+        xlsx_pinned = tmp_xlsx_factory()
+
+        rows_d, cols_d = xlsxturbo.csv_to_xlsx(hundred_row_csv, xlsx_default, parallel=True)
+        rows_p, cols_p = xlsxturbo.csv_to_xlsx(hundred_row_csv, xlsx_pinned, parallel=True, threads=2)
+        assert (rows_d, cols_d) == (rows_p, cols_p)
+        with closing(load_workbook_ro(xlsx_default)) as wb_d, closing(load_workbook_ro(xlsx_pinned)) as wb_p:
+            default_rows = active_ws(wb_d).iter_rows(values_only=True)
+            pinned_rows = active_ws(wb_p).iter_rows(values_only=True)
+            assert list(default_rows) == list(pinned_rows)
+
+    def test_csv_threads_requires_parallel(
+        self, tmp_xlsx_factory: Callable[..., str]
+    ) -> None:
+        """Passing threads without parallel=True is rejected, not silently ignored."""
+        csv_path = tmp_xlsx_factory(".csv")
+        Path(csv_path).write_text("a\n1\n")
+        with pytest.raises(ValueError, match="threads requires parallel"):
+            xlsxturbo.csv_to_xlsx(csv_path, tmp_xlsx_factory(), threads=2)
+
+    def test_csv_zero_threads_rejected(
+        self, tmp_xlsx_factory: Callable[..., str]
+    ) -> None:
+        """threads=0 is rejected rather than handed to the thread pool."""
+        csv_path = tmp_xlsx_factory(".csv")
+        Path(csv_path).write_text("a\n1\n")
+        with pytest.raises(ValueError, match="at least 1"):
+            xlsxturbo.csv_to_xlsx(csv_path, tmp_xlsx_factory(), parallel=True, threads=0)
 
     def test_csv_with_sheet_name(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """CSV conversion with custom sheet name."""
-        import csv
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
-        with Path(csv_path).open("w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["a"])
-            writer.writerow(["1"])
+        Path(csv_path).write_text("a\n1\n")
 
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_path, sheet_name="MySheet")
-        wb = load_workbook(xlsx_path)
-        assert "MySheet" in wb.sheetnames
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            assert "MySheet" in wb.sheetnames
 
 
 class TestUnicodeAndSpecialData:
@@ -542,14 +504,13 @@ class TestUnicodeAndSpecialData:
         rows, cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert rows == 3  # header + 2 data rows
         assert cols == 3
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].value == "价格"
-        assert ws["B1"].value == "Straße"
-        assert ws["C1"].value == "名前"
-        assert ws["B2"].value == "Berlin"
-        assert ws["C2"].value == "太郎"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].value == "价格"
+            assert ws["B1"].value == "Straße"
+            assert ws["C1"].value == "名前"
+            assert ws["B2"].value == "Berlin"
+            assert ws["C2"].value == "太郎"
 
     def test_emoji_in_data(self, tmp_xlsx: str) -> None:
         """Emoji characters in cell values."""
@@ -559,25 +520,23 @@ class TestUnicodeAndSpecialData:
         })
         rows, _cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert rows == 3
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["B2"].value == "\U0001f680"
-        assert ws["B3"].value == "\U0001f525"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["B2"].value == "\U0001f680"
+            assert ws["B3"].value == "\U0001f525"
 
     def test_mixed_type_column(self, tmp_xlsx: str) -> None:
         """Column with mixed int and string values (pandas object dtype)."""
         df = pd.DataFrame({"mixed": [1, "two", 3, "four", 5.5]})
         rows, _cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert rows == 6  # header + 5 rows
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == 1
-        assert ws["A3"].value == "two"
-        assert ws["A4"].value == 3
-        assert ws["A5"].value == "four"
-        assert ws["A6"].value == 5.5
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == 1
+            assert ws["A3"].value == "two"
+            assert ws["A4"].value == 3
+            assert ws["A5"].value == "four"
+            assert ws["A6"].value == 5.5
 
     def test_none_and_nat_values(self, tmp_xlsx: str) -> None:
         """None, NaT, and pd.NA values write as empty cells."""
@@ -588,24 +547,21 @@ class TestUnicodeAndSpecialData:
         })
         rows, _cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert rows == 4  # header + 3 rows
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # None/NA cells should be empty
-        assert ws["A3"].value is None or ws["A3"].value == ""
-        assert ws["B3"].value is None or ws["B3"].value == ""
-        assert ws["C2"].value.year == 2024
-        assert ws["C2"].value.month == 1
-        assert ws["C2"].value.day == 1
-        assert ws["C3"].value is None or ws["C3"].value == ""
-        assert ws["C4"].value.year == 2024
-        assert ws["C4"].value.month == 3
-        assert ws["C4"].value.day == 1
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # None/NA cells should be empty
+            assert ws["A3"].value is None or ws["A3"].value == ""
+            assert ws["B3"].value is None or ws["B3"].value == ""
+            assert ws["C2"].value.year == 2024
+            assert ws["C2"].value.month == 1
+            assert ws["C2"].value.day == 1
+            assert ws["C3"].value is None or ws["C3"].value == ""
+            assert ws["C4"].value.year == 2024
+            assert ws["C4"].value.month == 3
+            assert ws["C4"].value.day == 1
 
     def test_pandas_datetime64_preserves_datetime_and_fractional_seconds(self, tmp_xlsx: str) -> None:
         """Pandas datetime64[ns] columns write as datetimes, not strings."""
-        from datetime import datetime
-
         df = pd.DataFrame({
             "timestamp": pd.to_datetime([
                 "2024-01-01 12:34:56.789",
@@ -615,59 +571,50 @@ class TestUnicodeAndSpecialData:
         rows, cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert rows == 3
         assert cols == 1
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == datetime(2024, 1, 1, 12, 34, 56, 789000)
-        assert ws["A3"].value is None or ws["A3"].value == ""
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == datetime(2024, 1, 1, 12, 34, 56, 789000)
+            assert ws["A3"].value is None or ws["A3"].value == ""
 
     def test_non_ns_datetime64_out_of_range_writes_correct_date(self, tmp_xlsx: str) -> None:
         """datetime64[us] dates outside ns range must not wrap around."""
-        from datetime import datetime
-
         df = pd.DataFrame({
             "timestamp": np.array(["3000-01-01T00:00:00"], dtype="datetime64[us]")
         })
         rows, cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert rows == 2
         assert cols == 1
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == datetime(3000, 1, 1, 0, 0, 0)
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == datetime(3000, 1, 1, 0, 0, 0)
 
     def test_python_int_beyond_i64_writes_as_string(self, tmp_xlsx: str) -> None:
         """Oversized Python ints should not fall through to rounded f64."""
         value = 2**63 + 1025
         df = pd.DataFrame({"big": [value]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == str(value)
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == str(value)
 
     def test_i64_min_writes_as_string_without_overflow(self, tmp_xlsx: str) -> None:
         """The signed minimum value must use the precision-preserving fallback."""
         value = np.iinfo(np.int64).min
         df = pd.DataFrame({"min": np.array([value], dtype=np.int64)})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == str(value)
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == str(value)
 
     def test_dataframe_pre_1900_datetime_writes_as_string(self, tmp_xlsx: str) -> None:
         """DataFrame datetime paths match CSV behavior for Excel-unsupported dates."""
-        from datetime import datetime
-
         df = pd.DataFrame({
             "old": pd.Series([datetime(1850, 1, 1, 12, 0, 0)], dtype=object)
         })
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == "1850-01-01 12:00:00"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == "1850-01-01 12:00:00"
 
     def test_object_timestamp_fractional_seconds(self, tmp_xlsx: str) -> None:
         """Object-dtype pandas Timestamps go through the attribute branch.
@@ -680,15 +627,12 @@ class TestUnicodeAndSpecialData:
         Excel's f64 serial at real-world date magnitudes, so millisecond precision
         is the meaningful assertion here.)
         """
-        from datetime import datetime
-
         ts = pd.Timestamp("2024-01-01 12:34:56.789")
         df = pd.DataFrame({"t": pd.Series([ts], dtype=object)})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == datetime(2024, 1, 1, 12, 34, 56, 789000)
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == datetime(2024, 1, 1, 12, 34, 56, 789000)
 
     def test_timezone_aware_datetime_writes_wall_clock(self, tmp_xlsx: str) -> None:
         """Timezone-aware datetimes are written as their local wall-clock value.
@@ -697,16 +641,13 @@ class TestUnicodeAndSpecialData:
         Characterization test pinning the documented contract: 12:00 US/Eastern
         is stored as 12:00, NOT converted to its 17:00 UTC equivalent.
         """
-        from datetime import datetime
-
         df = pd.DataFrame(
             {"t": pd.to_datetime(["2024-01-01 12:00:00"]).tz_localize("US/Eastern")}
         )
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == datetime(2024, 1, 1, 12, 0, 0)
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == datetime(2024, 1, 1, 12, 0, 0)
 
     def test_all_none_column(self, tmp_xlsx: str) -> None:
         """Column with all None values."""
@@ -721,13 +662,12 @@ class TestUnicodeAndSpecialData:
         df = pd.DataFrame({"id": [large_int, 42]})
         rows, _cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert rows == 3
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Large int should be written as string to preserve precision
-        assert str(ws["A2"].value) == str(large_int)
-        # Normal int should be a number
-        assert ws["A3"].value == 42
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Large int should be written as string to preserve precision
+            assert str(ws["A2"].value) == str(large_int)
+            # Normal int should be a number
+            assert ws["A3"].value == 42
 
     def test_csv_with_bom(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """CSV file with UTF-8 BOM."""
@@ -758,11 +698,10 @@ class TestUnicodeAndSpecialData:
         rows, cols = xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
         assert rows == 3
         assert cols == 2
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        assert ws["A2"].value == "Smith, John"
-        assert ws["B2"].value == "123 Main St"
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == "Smith, John"
+            assert ws["B2"].value == "123 Main St"
 
     def test_polars_unicode(self, tmp_xlsx: str) -> None:
         """Unicode data through Polars DataFrames."""
@@ -772,10 +711,9 @@ class TestUnicodeAndSpecialData:
         })
         rows, _cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert rows == 4
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == "Tökyö"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == "Tökyö"
 
 
 class TestCsvErrorPaths:
@@ -799,8 +737,6 @@ class TestPreEpochDates:
 
     def test_pre_epoch_date_csv_becomes_string(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """CSV dates before 1900 are written as strings, not invalid serial numbers."""
-        import csv
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
         with Path(csv_path).open("w", newline="") as f:
@@ -809,16 +745,13 @@ class TestPreEpochDates:
             writer.writerow(["1899-01-01", "old"])
             writer.writerow(["2024-01-15", "new"])
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        # Pre-epoch date should be a string
-        assert ws["A2"].value == "1899-01-01"
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            # Pre-epoch date should be a string
+            assert ws["A2"].value == "1899-01-01"
 
     def test_1900_leap_year_bug_window_csv_becomes_string(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """CSV dates inside the 1900 leap-year-bug window (Jan/Feb 1900) become strings."""
-        import csv
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
         with Path(csv_path).open("w", newline="") as f:
@@ -826,16 +759,12 @@ class TestPreEpochDates:
             writer.writerow(["date"])
             writer.writerow(["1900-01-15"])
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        assert ws["A2"].value == "1900-01-15"
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == "1900-01-15"
 
     def test_first_real_date_csv_becomes_date(self, tmp_xlsx_factory: Callable[..., str]) -> None:
         """CSV date 1900-03-01 (Excel serial 61) is the first date written as a real date."""
-        import csv
-        from datetime import datetime
-
         csv_path = tmp_xlsx_factory(".csv")
         xlsx_path = tmp_xlsx_factory()
         with Path(csv_path).open("w", newline="") as f:
@@ -843,12 +772,11 @@ class TestPreEpochDates:
             writer.writerow(["date"])
             writer.writerow(["1900-03-01"])
         xlsxturbo.csv_to_xlsx(csv_path, xlsx_path)
-        wb = load_workbook(xlsx_path)
-        ws = active_ws(wb)
-        value = ws["A2"].value
-        assert isinstance(value, datetime)
-        assert (value.year, value.month, value.day) == (1900, 3, 1)
-        wb.close()
+        with closing(load_workbook_ro(xlsx_path)) as wb:
+            ws = active_ws(wb)
+            value = ws["A2"].value
+            assert isinstance(value, datetime)
+            assert (value.year, value.month, value.day) == (1900, 3, 1)
 
     def test_1900_leap_year_bug_window_dataframe_becomes_string(self, tmp_xlsx: str) -> None:
         """A datetime.date inside the 1900 leap-year-bug window is written as a string."""
@@ -856,10 +784,9 @@ class TestPreEpochDates:
 
         df = pd.DataFrame({"d": [datetime.date(1900, 1, 15)]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].value == "1900-01-15"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == "1900-01-15"
 
     def test_first_real_date_dataframe_becomes_date(self, tmp_xlsx: str) -> None:
         """datetime.date(1900, 3, 1) (Excel serial 61) is written as a real date."""
@@ -867,12 +794,11 @@ class TestPreEpochDates:
 
         df = pd.DataFrame({"d": [datetime.date(1900, 3, 1)]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        value = ws["A2"].value
-        assert value is not None
-        assert (value.year, value.month, value.day) == (1900, 3, 1)
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            value = ws["A2"].value
+            assert value is not None
+            assert (value.year, value.month, value.day) == (1900, 3, 1)
 
     def test_1900_leap_year_bug_window_datetime64_becomes_string(self, tmp_xlsx: str) -> None:
         """A datetime64[ns] column value inside the 1900 leap-year-bug window is written as a string.
@@ -884,23 +810,21 @@ class TestPreEpochDates:
         """
         df = pd.DataFrame({"d": pd.to_datetime(["1900-01-15"])})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        value = ws["A2"].value
-        assert isinstance(value, str)
-        assert value.startswith("1900-01-15")
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            value = ws["A2"].value
+            assert isinstance(value, str)
+            assert value.startswith("1900-01-15")
 
     def test_first_real_date_datetime64_becomes_date(self, tmp_xlsx: str) -> None:
         """A datetime64[ns] column value of 1900-03-01 (Excel serial 61) is written as a real date."""
         df = pd.DataFrame({"d": pd.to_datetime(["1900-03-01"])})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        value = ws["A2"].value
-        assert value is not None
-        assert (value.year, value.month, value.day) == (1900, 3, 1)
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            value = ws["A2"].value
+            assert value is not None
+            assert (value.year, value.month, value.day) == (1900, 3, 1)
 
 
 class TestDatetimeDateSubclasses:
@@ -922,18 +846,17 @@ class TestDatetimeDateSubclasses:
 
         df = pd.DataFrame({"d": pd.array([SubDT(2024, 6, 15, 10, 30, 0)], dtype=object)})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        value = ws["A2"].value
-        assert isinstance(value, datetime.datetime)
-        assert (value.year, value.month, value.day, value.hour, value.minute) == (
-            2024,
-            6,
-            15,
-            10,
-            30,
-        )
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            value = ws["A2"].value
+            assert isinstance(value, datetime.datetime)
+            assert (value.year, value.month, value.day, value.hour, value.minute) == (
+                2024,
+                6,
+                15,
+                10,
+                30,
+            )
 
     def test_date_subclass_written_as_date(self, tmp_xlsx: str) -> None:
         """A datetime.date subclass instance is written as a real date, not str()."""
@@ -944,13 +867,12 @@ class TestDatetimeDateSubclasses:
 
         df = pd.DataFrame({"d": pd.array([SubDate(2024, 6, 15)], dtype=object)})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx)
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        value = ws["A2"].value
-        assert value is not None
-        assert not isinstance(value, str)
-        assert (value.year, value.month, value.day) == (2024, 6, 15)
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            value = ws["A2"].value
+            assert value is not None
+            assert not isinstance(value, str)
+            assert (value.year, value.month, value.day) == (2024, 6, 15)
 
 
 class TestDataFrameSubclasses:
@@ -972,10 +894,11 @@ class TestDataFrameSubclasses:
         df = MyFrame({"name": ["Alice"], "age": [30]})
         rows, cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert (rows, cols) == (2, 2)
-        ws = active_ws(load_workbook(tmp_xlsx))
-        assert ws["A1"].value == "name"
-        assert ws["A2"].value == "Alice"
-        assert ws["B2"].value == 30
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].value == "name"
+            assert ws["A2"].value == "Alice"
+            assert ws["B2"].value == 30
 
     def test_polars_subclass_is_accepted(self, tmp_xlsx: str) -> None:
         """A polars.DataFrame subclass takes the polars iteration path."""
@@ -986,9 +909,10 @@ class TestDataFrameSubclasses:
         df = MyPlFrame({"name": ["Bob"], "age": [25]})
         rows, cols = xlsxturbo.df_to_xlsx(df, tmp_xlsx)
         assert (rows, cols) == (2, 2)
-        ws = active_ws(load_workbook(tmp_xlsx))
-        assert ws["A2"].value == "Bob"
-        assert ws["B2"].value == 25
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].value == "Bob"
+            assert ws["B2"].value == 25
 
     def test_unrelated_object_still_rejected(self, tmp_xlsx: str) -> None:
         """An object that merely looks DataFrame-ish is still refused."""
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import stat
 from collections.abc import Callable
+from contextlib import closing
 from pathlib import Path
 from typing import ClassVar
 
@@ -297,11 +298,10 @@ class TestErrorPaths:
         ]
         result = xlsxturbo.dfs_to_xlsx(sheets, tmp_xlsx)  # type: ignore[arg-type]
         assert len(result) == 2
-        wb = load_workbook(tmp_xlsx)
-        # Neither sheet has any data rows, so neither gets an actual Excel table.
-        assert len(wb["Sheet1"].tables) == 0
-        assert len(wb["Sheet2"].tables) == 0
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            # Neither sheet has any data rows, so neither gets an actual Excel table.
+            assert len(wb["Sheet1"].tables) == 0
+            assert len(wb["Sheet2"].tables) == 0
 
     def test_dfs_to_xlsx_empty_sheets_list_raises(self, tmp_xlsx: str) -> None:
         """dfs_to_xlsx rejects an empty sheets list instead of silently writing a blank workbook."""
@@ -29,6 +29,7 @@ import inspect
 import pickle
 import re
 from collections.abc import Callable
+from contextlib import closing
 from pathlib import Path
 from typing import Any
 
@@ -563,14 +564,13 @@ class TestCellsDictValuesStayInTheHierarchy:
         out = tmp_path / "out.xlsx"
         cells: dict[str, Any] = {"C1": {"value": "x", key: None}}
         xlsxturbo.df_to_xlsx(_frame(), out, cells=cells)
-        wb = load_workbook(out)
-        cell = active_ws(wb)["C1"]
-        assert cell.value == "x"
-        assert cell.number_format == "General"
-        assert cell.alignment.horizontal is None
-        assert cell.alignment.vertical is None
-        assert not cell.alignment.wrapText
-        wb.close()
+        with closing(load_workbook(out)) as wb:
+            cell = active_ws(wb)["C1"]
+            assert cell.value == "x"
+            assert cell.number_format == "General"
+            assert cell.alignment.horizontal is None
+            assert cell.alignment.vertical is None
+            assert not cell.alignment.wrapText
 
 
 # A chart series item whose option dict has a non-string key. The mistake is the
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import zipfile
+from contextlib import closing
 from pathlib import Path
 from typing import Any
 
@@ -11,7 +12,7 @@ import polars as pl
 import pytest
 import xlsxturbo
 
-from tests.helpers import HAS_OPENPYXL, active_ws, load_workbook
+from tests.helpers import HAS_OPENPYXL, active_ws, load_workbook, load_workbook_ro
 
 pytestmark = pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl required for content verification")
 
@@ -24,33 +25,30 @@ class TestColumnWidthCap:
         df = pd.DataFrame({"A": ["x" * 100], "B": ["y" * 100], "C": ["z" * 100]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_widths={"_all": 20})
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        for col in ["A", "B", "C"]:
-            assert ws.column_dimensions[col].width <= 21
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            for col in ["A", "B", "C"]:
+                assert ws.column_dimensions[col].width <= 21
 
     def test_specific_overrides_all(self, tmp_xlsx: str) -> None:
         """Override '_all' with a specific column width."""
         df = pd.DataFrame({"A": ["x"], "B": ["y"], "C": ["z"]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_widths={0: 30, "_all": 10})
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws.column_dimensions["A"].width > 25
-        assert ws.column_dimensions["B"].width <= 11
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws.column_dimensions["A"].width > 25
+            assert ws.column_dimensions["B"].width <= 11
 
     def test_all_with_autofit(self, tmp_xlsx: str) -> None:
         """Use '_all' as a cap when combined with autofit."""
         df = pd.DataFrame({"Short": ["x"], "VeryLongColumnName": ["y" * 100]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, autofit=True, column_widths={"_all": 25})
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Long column should be capped at ~25
-        assert ws.column_dimensions["B"].width <= 26
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Long column should be capped at ~25
+            assert ws.column_dimensions["B"].width <= 26
 
     def test_dfs_to_xlsx_per_sheet_all(self, tmp_xlsx: str) -> None:
         """Apply per-sheet '_all' override in dfs_to_xlsx."""
@@ -64,13 +62,12 @@ class TestColumnWidthCap:
             tmp_xlsx,
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        # Sheet1 should have narrower column than Sheet2
-        w1 = wb["Sheet1"].column_dimensions["A"].width or 0
-        w2 = wb["Sheet2"].column_dimensions["A"].width or 0
-        assert w1 <= 21, f"Sheet1 col A width {w1} should be <= 21"
-        assert w2 > 21, f"Sheet2 col A width {w2} should be > 21"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            # Sheet1 should have narrower column than Sheet2
+            w1 = wb["Sheet1"].column_dimensions["A"].width or 0
+            w2 = wb["Sheet2"].column_dimensions["A"].width or 0
+            assert w1 <= 21, f"Sheet1 col A width {w1} should be <= 21"
+            assert w2 > 21, f"Sheet2 col A width {w2} should be > 21"
 
     def test_autofit_with_all_cap(self, tmp_xlsx: str) -> None:
         """Cap autofit widths with _all instead of overriding."""
@@ -80,30 +77,28 @@ class TestColumnWidthCap:
             "Medium": ["hello world", "test data"],
         })
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, autofit=True, column_widths={"_all": 25})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        w_short = ws.column_dimensions["A"].width or 0
-        w_long = ws.column_dimensions["B"].width or 0
-        w_med = ws.column_dimensions["C"].width or 0
-        # Short column should be narrow (content-fitted, not inflated to 25)
-        assert w_short < 15, f"Short col width {w_short} should be < 15"
-        # VeryLong column should be capped at ~25
-        assert w_long <= 26, f"VeryLong col width {w_long} should be <= 26"
-        # Medium column should be content-fitted (< 25)
-        assert w_med < 20, f"Medium col width {w_med} should be < 20"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            w_short = ws.column_dimensions["A"].width or 0
+            w_long = ws.column_dimensions["B"].width or 0
+            w_med = ws.column_dimensions["C"].width or 0
+            # Short column should be narrow (content-fitted, not inflated to 25)
+            assert w_short < 15, f"Short col width {w_short} should be < 15"
+            # VeryLong column should be capped at ~25
+            assert w_long <= 26, f"VeryLong col width {w_long} should be <= 26"
+            # Medium column should be content-fitted (< 25)
+            assert w_med < 20, f"Medium col width {w_med} should be < 20"
 
     def test_autofit_with_all_cap_polars(self, tmp_xlsx: str) -> None:
         """Apply autofit + _all cap with polars DataFrames."""
         df = pl.DataFrame({"Short": ["x"], "Long": ["A" * 80]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, autofit=True, column_widths={"_all": 20})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        w_short = ws.column_dimensions["A"].width or 0
-        w_long = ws.column_dimensions["B"].width or 0
-        assert w_short < 15, f"Short col width {w_short} should be < 15"
-        assert w_long <= 21, f"Long col width {w_long} should be <= 21"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            w_short = ws.column_dimensions["A"].width or 0
+            w_long = ws.column_dimensions["B"].width or 0
+            assert w_short < 15, f"Short col width {w_short} should be < 15"
+            assert w_long <= 21, f"Long col width {w_long} should be <= 21"
 
     def test_empty_column_widths_does_not_suppress_autofit_per_sheet(self, tmp_xlsx: str) -> None:
         """A per-sheet column_widths={} combined with autofit=True no longer suppresses autofit.
@@ -120,11 +115,10 @@ class TestColumnWidthCap:
             tmp_xlsx,
             autofit=True,
         )
-        wb = load_workbook(tmp_xlsx)
-        width = wb["S1"].column_dimensions["A"].width
-        assert width is not None
-        assert width > 15, f"Autofitted column A width {width} should exceed the Excel default"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            width = wb["S1"].column_dimensions["A"].width
+            assert width is not None
+            assert width > 15, f"Autofitted column A width {width} should exceed the Excel default"
 
     def test_autofit_with_explicit_width_for_one_column(self, tmp_xlsx: str) -> None:
         """autofit=True with a column_widths override for one column still autofits the rest.
@@ -138,15 +132,14 @@ class TestColumnWidthCap:
             "B": ["y" * 60],
         })
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, autofit=True, column_widths={0: 25})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        w_a = ws.column_dimensions["A"].width
-        w_b = ws.column_dimensions["B"].width
-        assert w_a is not None
-        assert abs(w_a - 25) < 1, f"Explicit column A width {w_a} should be ~25"
-        assert w_b is not None
-        assert w_b > w_a, f"Autofitted column B width {w_b} should exceed column A's explicit width"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            w_a = ws.column_dimensions["A"].width
+            w_b = ws.column_dimensions["B"].width
+            assert w_a is not None
+            assert abs(w_a - 25) < 1, f"Explicit column A width {w_a} should be ~25"
+            assert w_b is not None
+            assert w_b > w_a, f"Autofitted column B width {w_b} should exceed column A's explicit width"
 
     def test_explicit_width_smaller_than_autofit_wins(self, tmp_xlsx: str) -> None:
         """An explicit width narrower than the autofit width is kept, not enlarged.
@@ -164,12 +157,11 @@ class TestColumnWidthCap:
             "B": ["x"],
         })
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, autofit=True, column_widths={0: 10})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        w_a = ws.column_dimensions["A"].width
-        assert w_a is not None
-        assert abs(w_a - 10) < 1, f"Explicit column A width {w_a} should stay ~10 despite wide content"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            w_a = ws.column_dimensions["A"].width
+            assert w_a is not None
+            assert abs(w_a - 10) < 1, f"Explicit column A width {w_a} should stay ~10 despite wide content"
 
     def test_column_widths_negative_key_raises(self, tmp_xlsx: str) -> None:
         """A negative column_widths key raises with a clear message."""
@@ -194,12 +186,11 @@ class TestColumnWidthCap:
         """A column_widths key beyond the DataFrame's column count is now applied, not ignored."""
         df = pd.DataFrame({"A": [1], "B": [2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_widths={5: 30.0})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Column index 5 (0-based) is column F, beyond the 2-column data range.
-        assert ws.column_dimensions["F"].width is not None
-        assert ws.column_dimensions["F"].width > 25
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Column index 5 (0-based) is column F, beyond the 2-column data range.
+            assert ws.column_dimensions["F"].width is not None
+            assert ws.column_dimensions["F"].width > 25
 
     def test_column_widths_string_key_exceeds_max_column_raises(self, tmp_xlsx: str) -> None:
         """A string column_widths key must pass the same max-column-index validation as an int key."""
@@ -226,12 +217,11 @@ class TestColumnWidthCap:
         """A valid numeric-string column_widths key beyond the DataFrame's column count is applied."""
         df = pd.DataFrame({"A": [1], "B": [2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_widths={"5": 30.0})  # type: ignore[dict-item]
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Column index 5 (0-based) is column F, beyond the 2-column data range.
-        assert ws.column_dimensions["F"].width is not None
-        assert ws.column_dimensions["F"].width > 25
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Column index 5 (0-based) is column F, beyond the 2-column data range.
+            assert ws.column_dimensions["F"].width is not None
+            assert ws.column_dimensions["F"].width > 25
 
 
 class TestTableName:
@@ -241,11 +231,10 @@ class TestTableName:
         """Apply an explicit table name."""
         df = pd.DataFrame({"A": [1, 2, 3]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, table_style="Medium2", table_name="MyTable")
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        tables = list(ws.tables.keys())
-        assert "MyTable" in tables
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            tables = list(ws.tables.keys())
+            assert "MyTable" in tables
 
     def test_table_name_sanitization(self, tmp_xlsx: str) -> None:
         """Sanitize invalid characters in table names."""
@@ -253,22 +242,20 @@ class TestTableName:
         xlsxturbo.df_to_xlsx(
             df, tmp_xlsx, table_style="Medium2", table_name="My Table-2024!"
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        tables = list(ws.tables.keys())
-        assert len(tables) == 1
-        assert "_" in tables[0]  # Some characters replaced with underscore
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            tables = list(ws.tables.keys())
+            assert len(tables) == 1
+            assert "_" in tables[0]  # Some characters replaced with underscore
 
     def test_table_name_starts_with_digit(self, tmp_xlsx: str) -> None:
         """Prefix table names starting with a digit with an underscore."""
         df = pd.DataFrame({"A": [1]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, table_style="Medium2", table_name="123Data")
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        tables = list(ws.tables.keys())
-        assert tables[0].startswith("_")
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            tables = list(ws.tables.keys())
+            assert tables[0].startswith("_")
 
     def test_per_sheet_table_names(self, tmp_xlsx: str) -> None:
         """Apply different table names per sheet."""
@@ -281,19 +268,17 @@ class TestTableName:
             ],
             tmp_xlsx,
         )
-        wb = load_workbook(tmp_xlsx)
-        assert "Table1" in wb["Sheet1"].tables
-        assert "Table2" in wb["Sheet2"].tables
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            assert "Table1" in wb["Sheet1"].tables
+            assert "Table2" in wb["Sheet2"].tables
 
     def test_no_table_name_without_table_style(self, tmp_xlsx: str) -> None:
         """Ignore table_name when table_style is None."""
         df = pd.DataFrame({"A": [1]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, table_name="Ignored")
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert len(ws.tables) == 0
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert len(ws.tables) == 0
 
     def test_duplicate_global_table_name_raises_before_save(self, tmp_xlsx: str) -> None:
         """Reject a global table name reused by multiple table-bearing sheets."""
@@ -334,21 +319,19 @@ class TestHeaderFormat:
         """Apply a bold header."""
         df = pd.DataFrame({"A": [1], "B": [2]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, header_format={"bold": True})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].font.bold is True
-        assert ws["B1"].font.bold is True
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].font.bold is True
+            assert ws["B1"].font.bold is True
 
     def test_header_background_color(self, tmp_xlsx: str) -> None:
         """Apply a background color to the header."""
         df = pd.DataFrame({"A": [1]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, header_format={"bg_color": "#4F81BD"})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # openpyxl uses ARGB format
-        assert ws["A1"].fill.fgColor.rgb == "FF4F81BD"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # openpyxl uses ARGB format
+            assert ws["A1"].fill.fgColor.rgb == "FF4F81BD"
 
     def test_header_format_hex_color_with_sign_raises(self, tmp_xlsx: str) -> None:
         """A hex color with a sign character (e.g. '#+12345') is rejected, not parsed as a number."""
@@ -362,10 +345,9 @@ class TestHeaderFormat:
         """Apply a font color to the header."""
         df = pd.DataFrame({"A": [1]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, header_format={"font_color": "white"})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].font.color.rgb == "FFFFFFFF"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].font.color.rgb == "FFFFFFFF"
 
     def test_combined_header_format(self, tmp_xlsx: str) -> None:
         """Combine multiple header format options."""
@@ -375,22 +357,20 @@ class TestHeaderFormat:
             tmp_xlsx,
             header_format={"bold": True, "bg_color": "#4F81BD", "font_color": "white"},
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].font.bold is True
-        assert ws["A1"].fill.fgColor.rgb == "FF4F81BD"
-        assert ws["A1"].font.color.rgb == "FFFFFFFF"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].font.bold is True
+            assert ws["A1"].fill.fgColor.rgb == "FF4F81BD"
+            assert ws["A1"].font.color.rgb == "FFFFFFFF"
 
     def test_header_format_no_header(self, tmp_xlsx: str) -> None:
         """Ignore header_format when header=False."""
         df = pd.DataFrame({"A": [1]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, header=False, header_format={"bold": True})
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # First row should be data, not header
-        assert ws["A1"].value == 1
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # First row should be data, not header
+            assert ws["A1"].value == 1
 
     def test_per_sheet_header_format(self, tmp_xlsx: str) -> None:
         """Apply different header formats per sheet."""
@@ -403,10 +383,9 @@ class TestHeaderFormat:
             ],
             tmp_xlsx,
         )
-        wb = load_workbook(tmp_xlsx)
-        assert wb["Sheet1"]["A1"].font.bold is True
-        assert wb["Sheet2"]["A1"].fill.fgColor.rgb == "FFFF0000"
-        wb.close()
+        with closing(load_workbook_ro(tmp_xlsx)) as wb:
+            assert wb["Sheet1"]["A1"].font.bold is True
+            assert wb["Sheet2"]["A1"].fill.fgColor.rgb == "FFFF0000"
 
 
 class TestRichText:
@@ -519,14 +498,13 @@ class TestRowHeights:
         df = pd.DataFrame({"A": [1, 2, 3]})
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, row_heights={0: 30, 2: 40})
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # openpyxl is 1-indexed; Excel may round heights slightly
-        assert abs(ws.row_dimensions[1].height - 30) < 1
-        assert abs(ws.row_dimensions[3].height - 40) < 1
-        # Rows without explicit height should not have customHeight
-        assert ws.row_dimensions[2].customHeight is False
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # openpyxl is 1-indexed; Excel may round heights slightly
+            assert abs(ws.row_dimensions[1].height - 30) < 1
+            assert abs(ws.row_dimensions[3].height - 40) < 1
+            # Rows without explicit height should not have customHeight
+            assert ws.row_dimensions[2].customHeight is False
 
     def test_row_heights_with_dfs_to_xlsx(self, tmp_xlsx: str) -> None:
         """Apply row heights per-sheet."""
@@ -536,10 +514,9 @@ class TestRowHeights:
             tmp_xlsx,
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = wb["Sheet1"]
-        assert abs(ws.row_dimensions[1].height - 25) < 1
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = wb["Sheet1"]
+            assert abs(ws.row_dimensions[1].height - 25) < 1
 
     def test_row_heights_ignored_in_constant_memory(self, tmp_xlsx: str) -> None:
         """Warn and ignore row heights in constant memory mode."""
@@ -547,12 +524,11 @@ class TestRowHeights:
         with pytest.warns(RuntimeWarning, match="row_heights"):
             xlsxturbo.df_to_xlsx(df, tmp_xlsx, constant_memory=True, row_heights={0: 50})
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Row height should NOT be set (constant memory ignores it)
-        # Default height is ~15, so it should not be 50
-        assert ws.row_dimensions[1].height != 50 or ws.row_dimensions[1].height is None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Row height should NOT be set (constant memory ignores it)
+            # Default height is ~15, so it should not be 50
+            assert ws.row_dimensions[1].height != 50 or ws.row_dimensions[1].height is None
 
 
 class TestBorderStyles:
@@ -564,14 +540,13 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border": True}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.left.style == "thin"
-        assert cell.border.right.style == "thin"
-        assert cell.border.top.style == "thin"
-        assert cell.border.bottom.style == "thin"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.left.style == "thin"
+            assert cell.border.right.style == "thin"
+            assert cell.border.top.style == "thin"
+            assert cell.border.bottom.style == "thin"
 
     def test_border_string_all_sides(self, tmp_xlsx: str) -> None:
         """Apply a thick border on all 4 sides with border='thick'."""
@@ -579,14 +554,13 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border": "thick"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.left.style == "thick"
-        assert cell.border.right.style == "thick"
-        assert cell.border.top.style == "thick"
-        assert cell.border.bottom.style == "thick"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.left.style == "thick"
+            assert cell.border.right.style == "thick"
+            assert cell.border.top.style == "thick"
+            assert cell.border.bottom.style == "thick"
 
     def test_border_right_only(self, tmp_xlsx: str) -> None:
         """Apply a thick right border only with border_right='thick'."""
@@ -594,14 +568,13 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border_right": "thick"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.right.style == "thick"
-        assert cell.border.left.style is None
-        assert cell.border.top.style is None
-        assert cell.border.bottom.style is None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.right.style == "thick"
+            assert cell.border.left.style is None
+            assert cell.border.top.style is None
+            assert cell.border.bottom.style is None
 
     def test_border_left_and_right(self, tmp_xlsx: str) -> None:
         """Apply mixed per-side borders."""
@@ -609,14 +582,13 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border_left": "medium", "border_right": "thick"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.left.style == "medium"
-        assert cell.border.right.style == "thick"
-        assert cell.border.top.style is None
-        assert cell.border.bottom.style is None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.left.style == "medium"
+            assert cell.border.right.style == "thick"
+            assert cell.border.top.style is None
+            assert cell.border.bottom.style is None
 
     def test_border_all_four_sides_individually(self, tmp_xlsx: str) -> None:
         """Set all four sides independently."""
@@ -629,14 +601,13 @@ class TestBorderStyles:
                 "border_bottom": "dashed",
             }
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.left.style == "thin"
-        assert cell.border.right.style == "thick"
-        assert cell.border.top.style == "medium"
-        assert cell.border.bottom.style == "dashed"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.left.style == "thin"
+            assert cell.border.right.style == "thick"
+            assert cell.border.top.style == "medium"
+            assert cell.border.bottom.style == "dashed"
 
     def test_border_string_thin(self, tmp_xlsx: str) -> None:
         """Treat border='thin' as equivalent to border=True."""
@@ -644,12 +615,11 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border": "thin"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.left.style == "thin"
-        assert cell.border.right.style == "thin"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.left.style == "thin"
+            assert cell.border.right.style == "thin"
 
     def test_border_with_wildcard_pattern(self, tmp_xlsx: str) -> None:
         """Apply per-side borders with wildcard column matching."""
@@ -657,12 +627,11 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "price_*": {"border_right": "thick"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].border.right.style == "thick"
-        assert ws["B2"].border.right.style == "thick"
-        assert ws["C2"].border.right.style is None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].border.right.style == "thick"
+            assert ws["B2"].border.right.style == "thick"
+            assert ws["C2"].border.right.style is None
 
     def test_border_color(self, tmp_xlsx: str) -> None:
         """Set color for all borders via border_color."""
@@ -670,13 +639,12 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border": "thin", "border_color": "red"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.left.style == "thin"
-        assert cell.border.left.color is not None
-        assert cell.border.left.color.rgb.endswith("FF0000")
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.left.style == "thin"
+            assert cell.border.left.color is not None
+            assert cell.border.left.color.rgb.endswith("FF0000")
 
     def test_invalid_border_style_raises(self, tmp_xlsx: str) -> None:
         """Raise ValueError for an invalid border style string."""
@@ -692,13 +660,12 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border_right": "thick", "bold": True, "num_format": "0.00"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.right.style == "thick"
-        assert cell.font.bold
-        assert cell.number_format == "0.00"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.right.style == "thick"
+            assert cell.font.bold
+            assert cell.number_format == "0.00"
 
     def test_border_per_side_overrides_all(self, tmp_xlsx: str) -> None:
         """Override all-sides border with a per-side border for that side."""
@@ -706,14 +673,13 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border": "thin", "border_right": "thick"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.left.style == "thin"
-        assert cell.border.right.style == "thick"
-        assert cell.border.top.style == "thin"
-        assert cell.border.bottom.style == "thin"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.left.style == "thin"
+            assert cell.border.right.style == "thick"
+            assert cell.border.top.style == "thin"
+            assert cell.border.bottom.style == "thin"
 
     def test_border_medium_style(self, tmp_xlsx: str) -> None:
         """Apply the medium border style."""
@@ -721,10 +687,9 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border": "medium"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].border.left.style == "medium"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].border.left.style == "medium"
 
     def test_border_double_style(self, tmp_xlsx: str) -> None:
         """Apply the double border style."""
@@ -732,10 +697,9 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border_bottom": "double"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].border.bottom.style == "double"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].border.bottom.style == "double"
 
     def test_border_with_polars(self, tmp_xlsx: str) -> None:
         """Apply border styles with polars DataFrames."""
@@ -743,10 +707,9 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border_right": "thick"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].border.right.style == "thick"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].border.right.style == "thick"
 
     def test_border_right_bool_treated_as_thin(self, tmp_xlsx: str) -> None:
         """Apply a thin right border for border_right=True (bool)."""
@@ -754,12 +717,11 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"border_right": True}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.border.right.style == "thin"
-        assert cell.border.left.style is None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.border.right.style == "thin"
+            assert cell.border.left.style is None
 
     def test_header_format_border(self, tmp_xlsx: str) -> None:
         """Support border styles in header_format."""
@@ -767,12 +729,11 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, header_format={
             "bold": True, "border": "thick"
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        header = ws["A1"]
-        assert header.border.left.style == "thick"
-        assert header.border.right.style == "thick"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            header = ws["A1"]
+            assert header.border.left.style == "thick"
+            assert header.border.right.style == "thick"
 
     def test_header_format_border_right_only(self, tmp_xlsx: str) -> None:
         """Support per-side borders in header_format."""
@@ -780,12 +741,11 @@ class TestBorderStyles:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, header_format={
             "border_bottom": "medium"
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        header = ws["A1"]
-        assert header.border.bottom.style == "medium"
-        assert header.border.top.style is None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            header = ws["A1"]
+            assert header.border.bottom.style == "medium"
+            assert header.border.top.style is None
 
     def test_border_dfs_to_xlsx_per_sheet(self, tmp_xlsx: str) -> None:
         """Apply per-side borders with dfs_to_xlsx per-sheet overrides."""
@@ -795,10 +755,9 @@ class TestBorderStyles:
             (df1, "S1"),
             (df2, "S2", {"column_formats": {"A": {"border_right": "thick"}}})
         ], tmp_xlsx, column_formats={"A": {"border": "thin"}})
-        wb = load_workbook(tmp_xlsx)
-        assert wb["S1"]["A2"].border.left.style == "thin"
-        assert wb["S2"]["A2"].border.right.style == "thick"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            assert wb["S1"]["A2"].border.left.style == "thin"
+            assert wb["S2"]["A2"].border.right.style == "thick"
 
 
 class TestTextAlignment:
@@ -810,10 +769,9 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"align_horizontal": "center"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].alignment.horizontal == "center"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].alignment.horizontal == "center"
 
     def test_column_format_horizontal_right(self, tmp_xlsx: str) -> None:
         """Right-align cell text with align_horizontal='right'."""
@@ -821,10 +779,9 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"align_horizontal": "right"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].alignment.horizontal == "right"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].alignment.horizontal == "right"
 
     def test_column_format_vertical_top(self, tmp_xlsx: str) -> None:
         """Top-align cell text with align_vertical='top'."""
@@ -832,10 +789,9 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"align_vertical": "top"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].alignment.vertical == "top"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].alignment.vertical == "top"
 
     def test_column_format_vertical_center(self, tmp_xlsx: str) -> None:
         """Vertically center cell text with align_vertical='center'."""
@@ -843,10 +799,9 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"align_vertical": "center"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].alignment.vertical == "center"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].alignment.vertical == "center"
 
     def test_column_format_wrap_text(self, tmp_xlsx: str) -> None:
         """Enable text wrapping with wrap_text=True."""
@@ -854,10 +809,9 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"wrap_text": True}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].alignment.wrapText is True
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].alignment.wrapText is True
 
     def test_column_format_combined_alignment(self, tmp_xlsx: str) -> None:
         """Combine horizontal, vertical, and wrap_text alignment."""
@@ -865,13 +819,12 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"align_horizontal": "center", "align_vertical": "top", "wrap_text": True}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.alignment.horizontal == "center"
-        assert cell.alignment.vertical == "top"
-        assert cell.alignment.wrapText is True
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.alignment.horizontal == "center"
+            assert cell.alignment.vertical == "top"
+            assert cell.alignment.wrapText is True
 
     def test_header_format_alignment(self, tmp_xlsx: str) -> None:
         """Support alignment in header_format."""
@@ -879,12 +832,11 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, header_format={
             "bold": True, "align_horizontal": "center", "wrap_text": True
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        header = ws["A1"]
-        assert header.alignment.horizontal == "center"
-        assert header.alignment.wrapText is True
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            header = ws["A1"]
+            assert header.alignment.horizontal == "center"
+            assert header.alignment.wrapText is True
 
     def test_merged_range_alignment(self, tmp_xlsx: str) -> None:
         """Support alignment in merged_ranges format."""
@@ -892,10 +844,9 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, merged_ranges=[
             ("A1:C1", "Title", {"bold": True, "align_horizontal": "left"})
         ])
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].alignment.horizontal == "left"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].alignment.horizontal == "left"
 
     def test_merged_range_default_center(self, tmp_xlsx: str) -> None:
         """Auto-center merged_ranges without explicit format."""
@@ -903,10 +854,9 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, merged_ranges=[
             ("A1:B1", "Title")
         ])
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].alignment.horizontal == "center"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].alignment.horizontal == "center"
 
     def test_cells_alignment(self, tmp_xlsx: str) -> None:
         """Support alignment options in the cells parameter."""
@@ -914,13 +864,12 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, cells={
             "C1": {"value": "Header", "align_horizontal": "center", "wrap_text": True}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["C1"]
-        assert cell.value == "Header"
-        assert cell.alignment.horizontal == "center"
-        assert cell.alignment.wrapText is True
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["C1"]
+            assert cell.value == "Header"
+            assert cell.alignment.horizontal == "center"
+            assert cell.alignment.wrapText is True
 
     def test_alignment_with_wildcard(self, tmp_xlsx: str) -> None:
         """Apply alignment with wildcard column patterns."""
@@ -928,13 +877,12 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "desc_*": {"align_horizontal": "left", "wrap_text": True}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].alignment.horizontal == "left"
-        assert ws["A2"].alignment.wrapText is True
-        assert ws["B2"].alignment.horizontal == "left"
-        assert ws["C2"].alignment.horizontal is None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].alignment.horizontal == "left"
+            assert ws["A2"].alignment.wrapText is True
+            assert ws["B2"].alignment.horizontal == "left"
+            assert ws["C2"].alignment.horizontal is None
 
     def test_alignment_with_border(self, tmp_xlsx: str) -> None:
         """Combine alignment with border styles."""
@@ -942,12 +890,11 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"align_horizontal": "center", "border": "thin"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        cell = ws["A2"]
-        assert cell.alignment.horizontal == "center"
-        assert cell.border.left.style == "thin"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            cell = ws["A2"]
+            assert cell.alignment.horizontal == "center"
+            assert cell.border.left.style == "thin"
 
     def test_invalid_horizontal_alignment_raises(self, tmp_xlsx: str) -> None:
         """Raise ValueError for an invalid horizontal alignment."""
@@ -971,7 +918,6 @@ class TestTextAlignment:
         xlsxturbo.df_to_xlsx(df, tmp_xlsx, column_formats={
             "A": {"align_horizontal": "center"}
         })
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A2"].alignment.horizontal == "center"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A2"].alignment.horizontal == "center"
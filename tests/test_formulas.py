@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from contextlib import closing
+
 import pandas as pd
 import pytest
 import xlsxturbo
@@ -21,14 +23,13 @@ class TestFormulaColumns:
             df, tmp_xlsx, formula_columns={"Total": "=A{row}*B{row}"}
         )
         assert cols == 3  # price, quantity, Total
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Header should be "Total"
-        assert ws["C1"].value == "Total"
-        # Data rows should have formulas (openpyxl shows them as =formula)
-        assert ws["C2"].value == "=A2*B2"
-        assert ws["C3"].value == "=A3*B3"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Header should be "Total"
+            assert ws["C1"].value == "Total"
+            # Data rows should have formulas (openpyxl shows them as =formula)
+            assert ws["C2"].value == "=A2*B2"
+            assert ws["C3"].value == "=A3*B3"
 
     def test_multiple_formula_columns(self, tmp_xlsx: str) -> None:
         """Multiple formula columns in order."""
@@ -42,13 +43,12 @@ class TestFormulaColumns:
             },
         )
         assert cols == 5  # price, qty, tax, Subtotal, TaxAmt
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["D1"].value == "Subtotal"
-        assert ws["E1"].value == "TaxAmt"
-        assert ws["D2"].value == "=A2*B2"
-        assert ws["E2"].value == "=D2*C2"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["D1"].value == "Subtotal"
+            assert ws["E1"].value == "TaxAmt"
+            assert ws["D2"].value == "=A2*B2"
+            assert ws["E2"].value == "=D2*C2"
 
     def test_formula_row_placeholder(self, tmp_xlsx: str) -> None:
         """The {row} placeholder is correctly replaced per row."""
@@ -56,12 +56,11 @@ class TestFormulaColumns:
         xlsxturbo.df_to_xlsx(
             df, tmp_xlsx, formula_columns={"Double": "=A{row}*2"}
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["B2"].value == "=A2*2"
-        assert ws["B3"].value == "=A3*2"
-        assert ws["B4"].value == "=A4*2"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["B2"].value == "=A2*2"
+            assert ws["B3"].value == "=A3*2"
+            assert ws["B4"].value == "=A4*2"
 
     def test_formula_columns_empty_dataframe(self, tmp_xlsx: str) -> None:
         """An empty DataFrame writes cleanly, skipping the formula column when there are no data rows."""
@@ -71,11 +70,10 @@ class TestFormulaColumns:
         )
         # No data rows -> the formula column is not appended.
         assert cols == 1
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert ws["A1"].value == "A"  # header still written
-        assert ws["B1"].value is None  # no formula column emitted
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert ws["A1"].value == "A"  # header still written
+            assert ws["B1"].value is None  # no formula column emitted
 
     def test_formula_with_dfs_to_xlsx(self, tmp_xlsx: str) -> None:
         """Formula columns work in multi-sheet mode."""
@@ -84,11 +82,10 @@ class TestFormulaColumns:
             [(df, "Sheet1", {"formula_columns": {"Sum": "=A{row}+10"}})],
             tmp_xlsx,
         )
-        wb = load_workbook(tmp_xlsx)
-        ws = wb["Sheet1"]
-        assert ws["B1"].value == "Sum"
-        assert ws["B2"].value == "=A2+10"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = wb["Sheet1"]
+            assert ws["B1"].value == "Sum"
+            assert ws["B2"].value == "=A2+10"
 
 
 class TestFormulaColumnsHeaderFalse:
@@ -103,13 +100,12 @@ class TestFormulaColumnsHeaderFalse:
             formula_columns={"Sum": "=A{row}+B{row}"},
         )
         assert cols == 3  # 2 data + 1 formula
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Row 1 should have data, not headers
-        assert ws["A1"].value == 10
-        # Formula column should be in C (0-indexed col 2)
-        assert ws["C1"].value is not None
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Row 1 should have data, not headers
+            assert ws["A1"].value == 10
+            # Formula column should be in C (0-indexed col 2)
+            assert ws["C1"].value is not None
 
     def test_formula_columns_header_true(self, tmp_xlsx: str) -> None:
         """Formula columns still work correctly when header=True."""
@@ -120,11 +116,10 @@ class TestFormulaColumnsHeaderFalse:
             formula_columns={"Sum": "=A{row}+B{row}"},
         )
         assert cols == 3
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Row 1 should have headers
-        assert ws["A1"].value == "A"
-        assert ws["C1"].value == "Sum"
-        # Row 2 should have data
-        assert ws["A2"].value == 10
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Row 1 should have headers
+            assert ws["A1"].value == "A"
+            assert ws["C1"].value == "Sum"
+            # Row 2 should have data
+            assert ws["A2"].value == 10
@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import base64
 import zipfile
 from collections.abc import Callable
+from contextlib import closing
 from pathlib import Path
 
 import pandas as pd
 import pytest
 import xlsxturbo
 
-from tests.helpers import HAS_OPENPYXL, TINY_PNG_B64, active_ws, load_workbook
+from tests.helpers import HAS_OPENPYXL, active_ws, load_workbook
 
 pytestmark = pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl required for content verification")
 
@@ -35,14 +35,13 @@ class TestAllFeaturesCombined:
             freeze_panes=True,
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert "StudentScores" in ws.tables
-        # freeze_panes=True must freeze the header row (split below row 1).
-        assert ws.freeze_panes == "A2"
-        # Note: table_style overrides header_format styling
-        # This is expected Excel behavior - tables have their own header styles
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert "StudentScores" in ws.tables
+            # freeze_panes=True must freeze the header row (split below row 1).
+            assert ws.freeze_panes == "A2"
+            # Note: table_style overrides header_format styling
+            # This is expected Excel behavior - tables have their own header styles
 
     def test_all_features_dfs_to_xlsx(self, tmp_xlsx: str) -> None:
         """All features work together in dfs_to_xlsx."""
@@ -75,24 +74,19 @@ class TestAllFeaturesCombined:
             freeze_panes=True,
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        assert "NumbersTable" in wb["Numbers"].tables
-        assert "LettersTable" in wb["Letters"].tables
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            assert "NumbersTable" in wb["Numbers"].tables
+            assert "LettersTable" in wb["Letters"].tables
 
 
 class TestV10AllFeatures:
     """Tests combining v0.10.0 features."""
 
-    def test_all_new_features_together(self, tmp_xlsx_factory: Callable[..., str]) -> None:
+    def test_all_new_features_together(self, tmp_xlsx_factory: Callable[..., str], tiny_png: str) -> None:
         """All v0.10.0 features work together."""
         df = pd.DataFrame({"Name": ["Alice", "Bob"], "Score": [85, 92]})
         path = tmp_xlsx_factory()
-
-        png_data = base64.b64decode(TINY_PNG_B64)
-        img_path = tmp_xlsx_factory(".png")
-        with Path(img_path).open("wb") as f:
-            f.write(png_data)
+        img_path = tiny_png
 
         xlsxturbo.df_to_xlsx(
             df,
@@ -104,22 +98,21 @@ class TestV10AllFeatures:
         )
         assert Path(path).exists()
 
-        wb = load_workbook(path)
-        ws = active_ws(wb)
-        # comments: both the plain-string and dict forms must land as real notes.
-        assert ws["A1"].comment is not None
-        assert "Names column" in ws["A1"].comment.text
-        b1_comment = ws["B1"].comment
-        assert b1_comment is not None
-        assert "Scores" in b1_comment.text
-        assert b1_comment.author == "Test"
-        # validations: a whole-number range must be registered on the Score column.
-        assert len(ws.data_validations.dataValidation) > 0
-        dv = ws.data_validations.dataValidation[0]
-        assert dv.type == "whole"
-        assert dv.formula1 == "0"
-        assert dv.formula2 == "100"
-        wb.close()
+        with closing(load_workbook(path)) as wb:
+            ws = active_ws(wb)
+            # comments: both the plain-string and dict forms must land as real notes.
+            assert ws["A1"].comment is not None
+            assert "Names column" in ws["A1"].comment.text
+            b1_comment = ws["B1"].comment
+            assert b1_comment is not None
+            assert "Scores" in b1_comment.text
+            assert b1_comment.author == "Test"
+            # validations: a whole-number range must be registered on the Score column.
+            assert len(ws.data_validations.dataValidation) > 0
+            dv = ws.data_validations.dataValidation[0]
+            assert dv.type == "whole"
+            assert dv.formula1 == "0"
+            assert dv.formula2 == "100"
 
         with zipfile.ZipFile(path) as zf:
             # rich_text: the bold and plain segments must both reach sharedStrings.xml.
@@ -144,16 +137,15 @@ class TestV10AllFeatures:
         )
         assert Path(tmp_xlsx).exists()
 
-        wb = load_workbook(tmp_xlsx)
-        # Sheet1: the per-sheet comment must land on its own sheet.
-        sheet1 = wb["Sheet1"]
-        assert sheet1["A1"].comment is not None
-        assert "First sheet header" in sheet1["A1"].comment.text
-        # Sheet2: the per-sheet validation must be registered, independent of Sheet1.
-        sheet2 = wb["Sheet2"]
-        assert len(sheet2.data_validations.dataValidation) > 0
-        dv = sheet2.data_validations.dataValidation[0]
-        assert dv.type == "whole"
-        assert dv.formula1 == "0"
-        assert dv.formula2 == "10"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            # Sheet1: the per-sheet comment must land on its own sheet.
+            sheet1 = wb["Sheet1"]
+            assert sheet1["A1"].comment is not None
+            assert "First sheet header" in sheet1["A1"].comment.text
+            # Sheet2: the per-sheet validation must be registered, independent of Sheet1.
+            sheet2 = wb["Sheet2"]
+            assert len(sheet2.data_validations.dataValidation) > 0
+            dv = sheet2.data_validations.dataValidation[0]
+            assert dv.type == "whole"
+            assert dv.formula1 == "0"
+            assert dv.formula2 == "10"
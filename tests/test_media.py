@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import base64
 import zipfile
 from collections.abc import Callable
 from pathlib import Path
@@ -12,7 +11,7 @@ import pandas as pd
 import pytest
 import xlsxturbo
 
-from tests.helpers import HAS_OPENPYXL, TINY_PNG_B64, active_ws, load_workbook
+from tests.helpers import HAS_OPENPYXL, active_ws, load_workbook
 
 if TYPE_CHECKING:
     from xlsxturbo.xlsxturbo import (
@@ -30,35 +29,27 @@ pytestmark = pytest.mark.skipif(not HAS_OPENPYXL, reason="openpyxl required for
 class TestImages:
     """Tests for images feature (v0.10.0)."""
 
-    def test_image_simple_path(self, tmp_xlsx_factory: Callable[..., str]) -> None:
+    def test_image_simple_path(self, tmp_xlsx_factory: Callable[..., str], tiny_png: str) -> None:
         """Image with simple path."""
         df = pd.DataFrame({"A": [1, 2, 3]})
         path = tmp_xlsx_factory()
-        png_data = base64.b64decode(TINY_PNG_B64)
-        img_path = tmp_xlsx_factory(".png")
-        with Path(img_path).open("wb") as f:
-            f.write(png_data)
 
-        xlsxturbo.df_to_xlsx(df, path, images={"D1": img_path})
+        xlsxturbo.df_to_xlsx(df, path, images={"D1": tiny_png})
         # The image must actually land in the package, not just produce a file.
         with zipfile.ZipFile(path) as zf:
             media = [n for n in zf.namelist() if n.startswith("xl/media/")]
             assert media, "no embedded image found in xl/media/"
             assert any(n.endswith(".png") for n in media)
 
-    def test_image_with_options(self, tmp_xlsx_factory: Callable[..., str]) -> None:
+    def test_image_with_options(self, tmp_xlsx_factory: Callable[..., str], tiny_png: str) -> None:
         """Image with scaling options."""
         df = pd.DataFrame({"A": [1]})
         path = tmp_xlsx_factory()
-        png_data = base64.b64decode(TINY_PNG_B64)
-        img_path = tmp_xlsx_factory(".png")
-        with Path(img_path).open("wb") as f:
-            f.write(png_data)
 
         xlsxturbo.df_to_xlsx(
             df,
             path,
-            images={"B5": {"path": img_path, "scale_width": 2.0, "scale_height": 2.0}},
+            images={"B5": {"path": tiny_png, "scale_width": 2.0, "scale_height": 2.0}},
         )
         with zipfile.ZipFile(path) as zf:
             media = [n for n in zf.namelist() if n.startswith("xl/media/")]
@@ -736,13 +727,11 @@ class TestDeterministicFeatureMapOrder:
     """
 
     def test_images_and_comments_order_is_stable_across_runs(
-        self, tmp_xlsx_factory: Callable[..., str]
+        self, tmp_xlsx_factory: Callable[..., str], tiny_png: str
     ) -> None:
         """Two writes with the same images/comments dicts emit identical drawing/comment XML."""
         df = pd.DataFrame({"A": [1, 2, 3, 4]})
-        png_path = tmp_xlsx_factory(".png")
-        with Path(png_path).open("wb") as f:
-            f.write(base64.b64decode(TINY_PNG_B64))
+        png_path = tiny_png
 
         # Insertion order deliberately out of cell-reference order, so a
         # HashMap's random iteration order would be very likely to visibly
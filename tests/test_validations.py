@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import closing
 from pathlib import Path
 
 import pandas as pd
@@ -25,15 +26,14 @@ class TestValidations:
             validations={"Status": {"type": "list", "values": ["Open", "Closed", "Pending"]}},
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert len(ws.data_validations.dataValidation) > 0
-        dv = ws.data_validations.dataValidation[0]
-        # Assert the type and that the dropdown values actually landed.
-        assert dv.type == "list"
-        assert "Open" in dv.formula1
-        assert "Pending" in dv.formula1
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert len(ws.data_validations.dataValidation) > 0
+            dv = ws.data_validations.dataValidation[0]
+            # Assert the type and that the dropdown values actually landed.
+            assert dv.type == "list"
+            assert "Open" in dv.formula1
+            assert "Pending" in dv.formula1
 
     def test_number_validation(self, tmp_xlsx: str) -> None:
         """Verify whole number range validation."""
@@ -44,15 +44,14 @@ class TestValidations:
             validations={"Score": {"type": "whole_number", "min": 0, "max": 100}},
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert len(ws.data_validations.dataValidation) > 0
-        dv = ws.data_validations.dataValidation[0]
-        # Assert the type and the min/max bounds, not just presence.
-        assert dv.type == "whole"
-        assert dv.formula1 == "0"
-        assert dv.formula2 == "100"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert len(ws.data_validations.dataValidation) > 0
+            dv = ws.data_validations.dataValidation[0]
+            # Assert the type and the min/max bounds, not just presence.
+            assert dv.type == "whole"
+            assert dv.formula1 == "0"
+            assert dv.formula2 == "100"
 
     def test_validation_with_messages(self, tmp_xlsx: str) -> None:
         """Verify validation with input and error messages."""
@@ -73,13 +72,12 @@ class TestValidations:
             },
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        assert len(ws.data_validations.dataValidation) > 0
-        dv = ws.data_validations.dataValidation[0]
-        assert dv.promptTitle == "Enter Value"
-        assert dv.errorTitle == "Invalid"
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            assert len(ws.data_validations.dataValidation) > 0
+            dv = ws.data_validations.dataValidation[0]
+            assert dv.promptTitle == "Enter Value"
+            assert dv.errorTitle == "Invalid"
 
     def test_whole_number_max_outside_i32_range_raises(self, tmp_xlsx: str) -> None:
         """A whole_number max outside the i32 range raises a clear, actionable error."""
@@ -113,11 +111,10 @@ class TestValidations:
             df, tmp_xlsx, validations={"score_*": {"type": "whole_number", "min": 0, "max": 100}}
         )
         assert Path(tmp_xlsx).exists()
-        wb = load_workbook(tmp_xlsx)
-        ws = active_ws(wb)
-        # Should have validations on the score columns
-        assert len(ws.data_validations.dataValidation) > 0
-        wb.close()
+        with closing(load_workbook(tmp_xlsx)) as wb:
+            ws = active_ws(wb)
+            # Should have validations on the score columns
+            assert len(ws.data_validations.dataValidation) > 0
 
     def test_validation_pattern_must_match(self, tmp_xlsx: str) -> None:
         """Validation patterns that match no columns raise an error."""